@@ -0,0 +1,131 @@
+"""
+Importable access to every Python implementation in this repository.
+
+The algorithms live in per-language folders whose names are not valid Python
+package names (``binary-search/python``, ``depth-first-search.py``, ...).
+This package gives each of them a stable module name:
+
+    from algorithms import binary_search, fibonacci
+    binary_search.binary_search([1, 2, 3], 2)
+
+The dotted names are real submodules, so these work too:
+
+    import algorithms.fibonacci
+    from algorithms.factorial import factorial_parallel
+
+Importing ``algorithms`` itself loads nothing; it only installs a finder for
+the ``algorithms.<name>`` modules. Each submodule is loaded from its source
+file the first time it is imported or accessed as an attribute (module-level
+``__getattr__``), and then cached in ``sys.modules``. Because worker
+processes can import the same dotted names, functions from these modules can
+be sent to process pools under the spawn and forkserver start methods.
+"""
+
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Stable module name -> source file, relative to the repository root
+_MODULES = {
+    # Problems
+    "factorial": "factorial/python/factorial.py",
+    "log_factorial": "factorial/python/log_factorial.py",
+    "fibonacci": "fibonacci/python/fibonacci.py",
+    "linear_recurrence": "fibonacci/python/linear_recurrence.py",
+    # Array-based search
+    "binary_search": "search/array-based-search/binary-search/python/binary_search.py",
+    "eytzinger_index": "search/array-based-search/binary-search/python/eytzinger_index.py",
+    "mmap_search": "search/array-based-search/binary-search/python/mmap_search.py",
+    "ship_packages": "search/array-based-search/binary-search-on-answer/python/ship_packages.py",
+    "exponential_search": "search/array-based-search/exponential-search/python/exponential_search.py",
+    "paged_exponential_search": "search/array-based-search/exponential-search/python/paged_exponential_search.py",
+    "fibonacci_search": "search/array-based-search/fibonacci-search/python/fibonacci_search.py",
+    "fibonacci_searcher": "search/array-based-search/fibonacci-search/python/fibonacci_searcher.py",
+    "hash_search": "search/array-based-search/hash-search/python/hash_search.py",
+    "interpolation_search": "search/array-based-search/interpolation-search/python/interpolation_search.py",
+    "learned_index": "search/array-based-search/interpolation-search/python/learned_index.py",
+    "jump_search": "search/array-based-search/jump-search/python/jump_search.py",
+    "compressed_jump_search": "search/array-based-search/jump-search/python/compressed_jump_search.py",
+    "linear_search": "search/array-based-search/linear-search/python/linear_search.py",
+    "linear_scan": "search/array-based-search/linear-search/python/linear_scan.py",
+    "self_organizing_search": "search/array-based-search/self-organizing-search/python/self_organizing_search.py",
+    "sentinel_search": "search/array-based-search/sentinel-search/python/sentinel_search.py",
+    "ternary_search": "search/array-based-search/ternary-search/python/ternary_search.py",
+    "parallel_ksection_search": "search/array-based-search/ternary-search/python/parallel_ksection_search.py",
+    "batch_peak_search": "search/array-based-search/ternary-search/python/batch_peak_search.py",
+    # Graph / tree search
+    "bidirectional_search": "search/graph-tree-search/bidirectional-search/python/bidirectional_search.py",
+    "breadth_first_search": "search/graph-tree-search/breadth-first-search/python/breadth_first_search.py",
+    "depth_first_search": "search/graph-tree-search/depth-first-search/python/depth-first-search.py",
+    "iddfs_search": "search/graph-tree-search/iterative-deepening-dfs/python/iddfs-search.py",
+    # State-space search
+    "bfs_8puzzle": "search/state-space-search/bfs/python/bfs_8puzzle.py",
+    "dfs_maze": "search/state-space-search/dfs/python/dfs_maze.py",
+    # Sorting
+    "bubble_sort": "sorting/bubble-sort/python/bubble_sort.py",
+    "bucket_sort": "sorting/bucket-sort/python/bucket_sort.py",
+    "comb_sort": "sorting/comb-sort/python/comb_sort.py",
+    "counting_sort": "sorting/counting-sort/python/counting_sort.py",
+    "cycle_sort": "sorting/cycle-sort/python/cycle_sort.py",
+    "heap_sort": "sorting/heap-sort/python/heap_sort.py",
+    "insertion_sort": "sorting/insertion-sort/python/insertion_sort.py",
+    "intro_sort": "sorting/intro-sort/python/intro_sort.py",
+    "merge_sort": "sorting/merge-sort/python/merge_sort.py",
+    "pigeonhole_sort": "sorting/pigeonhole-sort/python/pigeonhole_sort.py",
+    "quick_sort": "sorting/quick-sort/python/quick_sort.py",
+    "radix_sort": "sorting/radix-sort/python/radix_sort.py",
+    "selection_sort": "sorting/selection-sort/python/selection_sort.py",
+    "shell_sort": "sorting/shell-sort/python/shell_sort.py",
+    "tim_sort": "sorting/tim-sort/python/tim_sort.py",
+}
+
+__all__ = sorted(_MODULES)
+
+
+class _Finder:
+    """
+    Meta path finder that maps ``algorithms.<name>`` to the file in ``_MODULES``.
+    """
+
+    @staticmethod
+    def find_spec(fullname, path=None, target=None):
+        package, _, name = fullname.partition(".")
+        if package != __name__ or name not in _MODULES:
+            return None
+        # Deferred so that importing the package stays cheap
+        import importlib.util
+        return importlib.util.spec_from_file_location(fullname, os.path.join(_ROOT, _MODULES[name]))
+
+    @staticmethod
+    def invalidate_caches():
+        pass
+
+
+if not any(isinstance(finder, _Finder) for finder in sys.meta_path):
+    sys.meta_path.append(_Finder())
+
+
+def _load(name):
+    """
+    Imports one implementation through the regular import system.
+
+    Args:
+        name (str): Stable module name (a key of ``_MODULES``).
+
+    Returns:
+        module: The loaded module.
+    """
+    import importlib
+    # The import system caches the module in sys.modules and sets it as a package attribute
+    return importlib.import_module(f"{__name__}.{name}")
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        return _load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
@@ -0,0 +1,81 @@
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import unittest
+
+import algorithms
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestAlgorithmsPackage(unittest.TestCase):
+
+    def test_import_loads_no_submodules(self):
+        # Run in a fresh interpreter so other tests cannot have loaded anything
+        code = (
+            "import sys, algorithms; "
+            "print(sorted(m for m in sys.modules if m.startswith('algorithms.')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "[]")
+
+    def test_every_module_loads_without_output(self):
+        for name in algorithms.__all__:
+            with self.subTest(module=name):
+                buffer = io.StringIO()
+                with contextlib.redirect_stdout(buffer):
+                    module = getattr(algorithms, name)
+                self.assertEqual(buffer.getvalue(), "")
+                self.assertIs(sys.modules[f"algorithms.{name}"], module)
+
+    def test_hyphenated_files_are_importable(self):
+        from algorithms import depth_first_search, iddfs_search
+        self.assertTrue(hasattr(iddfs_search, "iddfs"))
+        self.assertIsNotNone(depth_first_search)
+
+    def test_module_is_loaded_once(self):
+        self.assertIs(algorithms.fibonacci, algorithms.fibonacci)
+        self.assertEqual(algorithms.fibonacci.fibonacci_iterative(10), 55)
+
+    def test_dotted_imports(self):
+        import algorithms.fibonacci
+        from algorithms.factorial import factorial_iterative
+        from algorithms.linear_search import linear_search
+        self.assertEqual(algorithms.fibonacci.fibonacci(20), 6765)
+        self.assertEqual(factorial_iterative(5), 120)
+        self.assertEqual(linear_search([4, 5, 6], 6), 2)
+        self.assertIs(sys.modules["algorithms.factorial"], algorithms.factorial)
+
+    def test_unknown_dotted_import(self):
+        with self.assertRaises(ModuleNotFoundError):
+            import algorithms.not_an_algorithm  # noqa: F401
+
+    def test_spawned_workers_import_submodules(self):
+        # Spawned workers re-import algorithms.factorial by name
+        code = (
+            "import math, multiprocessing\n"
+            "from concurrent.futures import ProcessPoolExecutor\n"
+            "from algorithms.factorial import factorial_parallel, factorial_binary_splitting\n"
+            "if __name__ == '__main__':\n"
+            "    multiprocessing.set_start_method('spawn')\n"
+            "    assert factorial_parallel(3000, workers=2) == math.factorial(3000)\n"
+            "    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context('spawn')) as pool:\n"
+            "        assert list(pool.map(factorial_binary_splitting, [5, 10])) == [120, 3628800]\n"
+            "    print('ok')\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=120
+        )
+        self.assertEqual(output.stdout.strip(), "ok", output.stderr)
+
+    def test_unknown_name(self):
+        with self.assertRaises(AttributeError):
+            algorithms.not_an_algorithm
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import argparse
+import time
+
+from factorial import factorial_binary_splitting, factorial_iterative, factorial_prime_swing
+
+
+def time_call(func, n, repeat):
+    # Best of `repeat` runs, in seconds
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(n)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(exponents, repeat, max_iterative):
+    header = f"{'n':>10}{'Iterative':>14}{'Binary split':>14}{'Prime swing':>14}{'Speedup':>10}"
+    print(header)
+    print("-" * len(header))
+    for n in (10 ** e for e in exponents):
+        splitting = time_call(factorial_binary_splitting, n, repeat)
+        swing = time_call(factorial_prime_swing, n, repeat)
+        if n <= max_iterative:
+            iterative = time_call(factorial_iterative, n, repeat)
+            row = f"{n:>10}{iterative * 1000:>12.2f}ms"
+            speedup = f"{iterative / min(splitting, swing):>9.1f}x"
+        else:
+            # The quadratic loop takes minutes past this size (shown as "-")
+            row = f"{n:>10}{'-':>14}"
+            speedup = f"{'-':>10}"
+        row += f"{splitting * 1000:>12.2f}ms{swing * 1000:>12.2f}ms{speedup}"
+        print(row)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the factorial implementations.")
+    parser.add_argument("--min-exp", type=int, default=3, help="smallest n is 10^min-exp (default: 3)")
+    parser.add_argument("--max-exp", type=int, default=6, help="largest n is 10^max-exp (default: 6)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement, best is kept (default: 3)")
+    parser.add_argument("--max-iterative", type=int, default=10 ** 5,
+                        help="largest n for factorial_iterative (default: 10^5)")
+    args = parser.parse_args()
+
+    print("⏱️ Factorial Benchmark (best of %d runs)\n" % args.repeat)
+    run(range(args.min_exp, args.max_exp + 1), args.repeat, args.max_iterative)
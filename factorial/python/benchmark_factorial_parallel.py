@@ -0,0 +1,40 @@
+import argparse
+import os
+import time
+
+from factorial import factorial_parallel
+
+
+def time_call(n, workers, chunks, repeat):
+    # Best of `repeat` runs, in seconds
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        factorial_parallel(n, workers=workers, chunks=chunks)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(n, max_workers, chunks_per_worker, repeat):
+    header = f"{'Workers':>8}{'Time':>14}{'Speedup':>10}{'Efficiency':>12}"
+    print(header)
+    print("-" * len(header))
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        seconds = time_call(n, workers, chunks_per_worker * workers, repeat)
+        baseline = baseline or seconds
+        speedup = baseline / seconds
+        print(f"{workers:>8}{seconds * 1000:>12.2f}ms{speedup:>9.2f}x{speedup / workers:>11.0%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scaling curve of factorial_parallel from 1 to N workers.")
+    parser.add_argument("--n", type=int, default=3 * 10 ** 5, help="compute n! (default: 300000)")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1,
+                        help="largest worker count (default: number of CPUs)")
+    parser.add_argument("--chunks-per-worker", type=int, default=4, help="subranges per worker (default: 4)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement, best is kept (default: 3)")
+    args = parser.parse_args()
+
+    print("⏱️ Parallel Factorial Benchmark: %d! (best of %d runs)\n" % (args.n, args.repeat))
+    run(args.n, args.max_workers, args.chunks_per_worker, args.repeat)
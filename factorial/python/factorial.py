@@ -1,3 +1,8 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+
 # recursive
 def factorial_recursive(n):
     if n == 0:
@@ -13,8 +18,231 @@ def factorial_iterative(n):
     return result
 
 
+# binary splitting (product tree)
+def _range_product(low, high):
+    # product of low * (low + 1) * ... * high, split in halves so both operands stay balanced
+    if high - low < 8:
+        result = 1
+        for i in range(low, high + 1):
+            result *= i
+        return result
+    mid = (low + high) // 2
+    return _range_product(low, mid) * _range_product(mid + 1, high)
+
+
+def factorial_binary_splitting(n):
+    if n < 2:
+        return 1
+    return _range_product(2, n)
+
+
+# prime swing
+def _primes_up_to(n):
+    # sieve of Eratosthenes
+    if n < 2:
+        return []
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, int(n ** 0.5) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    return [p for p in range(2, n + 1) if sieve[p]]
+
+
+def _list_product(values, low=0, high=None):
+    # balanced product of values[low:high]
+    if high is None:
+        high = len(values)
+    if high - low < 8:
+        result = 1
+        for i in range(low, high):
+            result *= values[i]
+        return result
+    mid = (low + high) // 2
+    return _list_product(values, low, mid) * _list_product(values, mid, high)
+
+
+def _swing(n, primes):
+    # n! / ((n // 2)!)^2, built from prime powers:
+    # the exponent of p is the number of odd values in n // p, n // p^2, ...
+    factors = []
+    for p in primes:
+        if p > n:
+            break
+        q, power = n, 1
+        while q >= p:
+            q //= p
+            if q & 1:
+                power *= p
+        if power > 1:
+            factors.append(power)
+    return _list_product(factors)
+
+
+def factorial_prime_swing(n):
+    if n < 2:
+        return 1
+    primes = _primes_up_to(n)
+    # n! = ((n // 2)!)^2 * swing(n), unrolled from the bottom up
+    result = 1
+    for m in reversed([n >> k for k in range(n.bit_length()) if n >> k >= 2]):
+        result = result * result * _swing(m, primes)
+    return result
+
+
+# prime factorization (Legendre's formula)
+def _legendre(n, p):
+    # exponent of the prime p in n! = n // p + n // p^2 + ...
+    e = 0
+    while n:
+        n //= p
+        e += n
+    return e
+
+
+def factorial_factorization(n):
+    # {prime: exponent} of n!, without computing n! itself
+    return {p: _legendre(n, p) for p in _primes_up_to(n)}
+
+
+def binomial_factorization(n, k):
+    # {prime: exponent} of n! / (k! * (n - k)!), primes with exponent 0 are left out
+    if k < 0 or k > n:
+        raise ValueError("k must be in [0, n]")
+    k = min(k, n - k)
+    factors = {}
+    for p in _primes_up_to(n):
+        e = _legendre(n, p) - _legendre(k, p) - _legendre(n - k, p)
+        if e:
+            factors[p] = e
+    return factors
+
+
+def binomial_exact(n, k):
+    # exact n choose k: only the surviving prime powers are multiplied, in a balanced tree
+    if k < 0 or k > n:
+        return 0
+    return _list_product([p ** e for p, e in binomial_factorization(n, k).items()])
+
+
+# parallel product tree
+def _multiply(a, b):
+    return a * b
+
+
+def factorial_parallel(n, workers=None, chunks=None):
+    # workers: number of processes (default: os.cpu_count())
+    # chunks: number of subranges of 1..n to multiply (default: 4 per worker)
+    if n < 2:
+        return 1
+    workers = workers or os.cpu_count() or 1
+    chunks = max(1, min(chunks or 4 * workers, n - 1))
+
+    # split 2..n into `chunks` contiguous ranges of (almost) equal length
+    size, extra = divmod(n - 1, chunks)
+    ranges = []
+    low = 2
+    for c in range(chunks):
+        high = low + size - 1 + (1 if c < extra else 0)
+        ranges.append((low, high))
+        low = high + 1
+
+    if workers == 1:
+        return _list_product([_range_product(low, high) for low, high in ranges])
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parts = list(executor.map(_range_product, *zip(*ranges)))
+        # combine neighbours level by level, so every multiplication is balanced
+        while len(parts) > 1:
+            pairs = list(zip(parts[0::2], parts[1::2]))
+            combined = list(executor.map(_multiply, *zip(*pairs)))
+            if len(parts) % 2:
+                combined.append(parts[-1])
+            parts = combined
+    return parts[0]
+
+
+# factorial table (mod p)
+class FactorialTable:
+    # n! mod p and 1 / n! mod p for every n up to a bound, for a prime p < 2^64.
+    # Both tables are compact array('Q') buffers and grow on demand.
+    def __init__(self, modulus, limit=0):
+        if not 2 <= modulus < 1 << 64:
+            raise ValueError("modulus must be a prime in [2, 2^64)")
+        self.modulus = modulus
+        self.fact = array("Q", [1])
+        self.inv_fact = array("Q", [1])
+        self.grow(limit)
+
+    def __len__(self):
+        return len(self.fact)
+
+    def grow(self, limit):
+        # extend both tables to cover 0..limit in O(limit - current size)
+        p = self.modulus
+        # beyond p - 1 every factorial is 0 mod p and has no inverse
+        limit = min(limit, p - 1)
+        start = len(self.fact)
+        if limit < start:
+            return
+
+        fact = self.fact
+        f = fact[-1]
+        for i in range(start, limit + 1):
+            f = f * i % p
+            fact.append(f)
+
+        # one modular inverse for the top entry, then walk down:
+        # 1 / (i - 1)! = i / i!
+        new = [0] * (limit - start + 1)
+        inv = pow(f, -1, p)
+        for i in range(limit, start - 1, -1):
+            new[i - start] = inv
+            inv = inv * i % p
+        self.inv_fact.extend(new)
+
+    def _ensure(self, n):
+        # grow geometrically so a stream of rising n costs O(1) amortized
+        if n >= len(self.fact):
+            self.grow(max(n, 2 * len(self.fact)))
+
+    def factorial(self, n):
+        if n >= self.modulus:
+            return 0
+        self._ensure(n)
+        return self.fact[n]
+
+    def inverse_factorial(self, n):
+        if n >= self.modulus:
+            raise ValueError("n! is 0 mod p and has no inverse")
+        self._ensure(n)
+        return self.inv_fact[n]
+
+    def binom(self, n, k):
+        # n choose k mod p
+        if k < 0 or k > n:
+            return 0
+        p = self.modulus
+        if n >= p:
+            # Lucas' theorem: multiply the binomials of the base-p digits
+            result = 1
+            while n and result:
+                result = result * self.binom(n % p, k % p) % p
+                n //= p
+                k //= p
+            return result
+        self._ensure(n)
+        return self.fact[n] * self.inv_fact[k] % p * self.inv_fact[n - k] % p
+
+
 # test
 if __name__ == "__main__":
     num = 5
     print("Recursive:", factorial_recursive(num))   # Output: 120
     print("Iterative:", factorial_iterative(num))   # Output: 120
+    print("Binary splitting:", factorial_binary_splitting(num))   # Output: 120
+    print("Prime swing:", factorial_prime_swing(num))   # Output: 120
+    print("Factorization of 10!:", factorial_factorization(10))   # Output: {2: 8, 3: 4, 5: 2, 7: 1}
+    print("Exact 10 choose 3:", binomial_exact(10, 3))   # Output: 120
+    table = FactorialTable(10 ** 9 + 7)
+    print("10 choose 3 mod 1e9+7:", table.binom(10, 3))   # Output: 120
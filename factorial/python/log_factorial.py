@@ -0,0 +1,74 @@
+import math
+import operator
+import sys
+from array import array
+
+# log(n!) for every n below this size comes from a precomputed table
+LOG_FACTORIAL_TABLE_SIZE = 256
+
+_HALF_LOG_TWO_PI = 0.5 * math.log(2 * math.pi)
+_table = None
+
+
+def _log_factorial_table():
+    # log(0!) .. log(255!), filled once on first use
+    global _table
+    if _table is None:
+        _table = array("d", (math.lgamma(n + 1) for n in range(LOG_FACTORIAL_TABLE_SIZE)))
+    return _table
+
+
+def _stirling(n, log=math.log):
+    # Stirling series for log(n!), n >= LOG_FACTORIAL_TABLE_SIZE:
+    # n log n - n + log(2 pi n) / 2 + 1 / (12 n) - 1 / (360 n^3)
+    # The series alternates, so the truncation error is below the next term,
+    # 1 / (1260 n^5) < 1e-15 for n >= 256 (far below float64 rounding at log(256!) ~ 1167).
+    # Works on NumPy arrays too when called with log=numpy.log.
+    inv = 1.0 / n
+    inv2 = inv * inv
+    log_n = log(n)
+    return n * log_n - n + _HALF_LOG_TWO_PI + 0.5 * log_n + inv * (1.0 / 12 - inv2 / 360)
+
+
+def log_factorial(n):
+    # log(n!) for one integer n >= 0
+    # operator.index rejects floats, which would be truncated or fed to Stirling
+    n = operator.index(n)
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if n < LOG_FACTORIAL_TABLE_SIZE:
+        return _log_factorial_table()[n]
+    return _stirling(float(n))
+
+
+def log_factorial_array(ns):
+    # log(n!) for a whole list or NumPy array of integers n >= 0
+    #
+    # Returns a float64 NumPy array for NumPy input, otherwise array('d').
+    # Error bounds: table entries (n < 256) are math.lgamma
+    # values (within about 1 ulp); above that the Stirling truncation error is below 1e-15, so the
+    # result is within a few units in the last place (relative error < 1e-15).
+    if type(ns).__module__ != "numpy":
+        return array("d", (log_factorial(n) for n in ns))
+
+    np = sys.modules["numpy"]
+    table = _log_factorial_table()
+    values = ns
+    if values.dtype.kind not in "iu":
+        raise TypeError(f"n must be integers, got dtype {values.dtype}")
+    if values.size and values.min() < 0:
+        raise ValueError("n must be non-negative")
+    result = np.empty(values.shape, dtype=np.float64)
+    small = values < LOG_FACTORIAL_TABLE_SIZE
+    result[small] = np.frombuffer(table, dtype=np.float64)[values[small].astype(np.intp)]
+    large = ~small
+    if large.any():
+        result[large] = _stirling(values[large].astype(np.float64), np.log)
+    return result
+
+
+# test
+if __name__ == "__main__":
+    print("log(10!):", log_factorial(10))   # Output: 15.104412573075514
+    print("log(1000!):", log_factorial(1000))   # Output: 5912.128178488163
+    print("Batch:", list(log_factorial_array([0, 1, 5, 300])))
@@ -0,0 +1,99 @@
+import math
+import unittest
+
+import factorial
+from factorial import FactorialTable
+
+
+class TestFactorial(unittest.TestCase):
+
+    def test_methods_match_math_factorial(self):
+        for n in list(range(0, 120)) + [257, 1000, 3001]:
+            expected = math.factorial(n)
+            with self.subTest(n=n):
+                self.assertEqual(factorial.factorial_iterative(n), expected)
+                self.assertEqual(factorial.factorial_binary_splitting(n), expected)
+                self.assertEqual(factorial.factorial_prime_swing(n), expected)
+                if n < 500:
+                    self.assertEqual(factorial.factorial_recursive(n), expected)
+
+
+class TestFactorialTable(unittest.TestCase):
+
+    def test_factorials_and_inverses(self):
+        p = 10 ** 9 + 7
+        table = FactorialTable(p, limit=10)
+        self.assertEqual(len(table), 11)
+        for n in (0, 1, 10, 11, 500, 2000):
+            self.assertEqual(table.factorial(n), math.factorial(n) % p)
+            self.assertEqual(table.factorial(n) * table.inverse_factorial(n) % p, 1)
+
+    def test_small_prime(self):
+        p = 13
+        table = FactorialTable(p)
+        for n in range(0, 30):
+            self.assertEqual(table.factorial(n), math.factorial(n) % p)
+        self.assertEqual(len(table), p)
+        with self.assertRaises(ValueError):
+            table.inverse_factorial(p)
+
+    def test_binom_with_lucas(self):
+        # n >= p goes through Lucas' theorem
+        for p in (2, 3, 7, 13):
+            table = FactorialTable(p)
+            for n in range(0, 60):
+                for k in range(-1, n + 2):
+                    expected = math.comb(n, k) % p if k >= 0 else 0
+                    self.assertEqual(table.binom(n, k), expected)
+        table = FactorialTable(10 ** 9 + 7)
+        self.assertEqual(table.binom(3000, 1500), math.comb(3000, 1500) % (10 ** 9 + 7))
+
+    def test_large_prime_modulus(self):
+        p = (1 << 61) - 1
+        table = FactorialTable(p, limit=100)
+        self.assertEqual(table.factorial(100), math.factorial(100) % p)
+        self.assertEqual(table.binom(100, 37), math.comb(100, 37) % p)
+
+    def test_modulus_must_fit(self):
+        for modulus in (1, 1 << 64):
+            with self.assertRaises(ValueError):
+                FactorialTable(modulus)
+
+
+class TestFactorialParallel(unittest.TestCase):
+
+    def test_matches_math_factorial(self):
+        for n, chunks in ((0, None), (1, None), (2, None), (100, 3), (5000, None), (5000, 7)):
+            with self.subTest(n=n, chunks=chunks):
+                self.assertEqual(factorial.factorial_parallel(n, workers=2, chunks=chunks), math.factorial(n))
+
+
+class TestFactorization(unittest.TestCase):
+
+    def test_legendre(self):
+        for n in (0, 1, 10, 100, 1000):
+            for p in (2, 3, 5, 7, 97):
+                m, e = math.factorial(n), 0
+                while m % p == 0:
+                    m //= p
+                    e += 1
+                self.assertEqual(factorial._legendre(n, p), e)
+
+    def test_factorial_factorization(self):
+        for n in (0, 1, 2, 30, 200):
+            product = math.prod(p ** e for p, e in factorial.factorial_factorization(n).items())
+            self.assertEqual(product, math.factorial(n))
+
+    def test_binomial(self):
+        for n in range(0, 60):
+            for k in range(-1, n + 2):
+                with self.subTest(n=n, k=k):
+                    self.assertEqual(factorial.binomial_exact(n, k), math.comb(n, k) if k >= 0 else 0)
+        self.assertEqual(factorial.binomial_exact(5000, 1234), math.comb(5000, 1234))
+        self.assertTrue(all(e > 0 for e in factorial.binomial_factorization(100, 50).values()))
+        with self.assertRaises(ValueError):
+            factorial.binomial_factorization(5, 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import math
+import unittest
+from array import array
+
+from log_factorial import LOG_FACTORIAL_TABLE_SIZE, log_factorial, log_factorial_array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Both sides of the table edge, and large n served by the Stirling series
+SAMPLES = [0, 1, 2, 10, 254, 255, 256, 257, 1000, 10 ** 7, 10 ** 9, 10 ** 12]
+
+
+class TestLogFactorial(unittest.TestCase):
+
+    def assertCloseToLgamma(self, n, value):
+        # Within a few units in the last place of math.lgamma
+        self.assertTrue(math.isclose(value, math.lgamma(n + 1), rel_tol=4e-15, abs_tol=1e-15), (n, value))
+
+    def test_matches_lgamma(self):
+        self.assertEqual(LOG_FACTORIAL_TABLE_SIZE, 256)
+        for n in SAMPLES + list(range(LOG_FACTORIAL_TABLE_SIZE - 3, LOG_FACTORIAL_TABLE_SIZE + 3)):
+            with self.subTest(n=n):
+                self.assertCloseToLgamma(n, log_factorial(n))
+
+    def test_invalid_n(self):
+        with self.assertRaises(ValueError):
+            log_factorial(-1)
+        with self.assertRaises(TypeError):
+            log_factorial(300.7)
+
+    def test_list_returns_array(self):
+        result = log_factorial_array(SAMPLES)
+        self.assertIsInstance(result, array)
+        self.assertEqual(result.typecode, "d")
+        for n, value in zip(SAMPLES, result):
+            self.assertCloseToLgamma(n, value)
+        with self.assertRaises(ValueError):
+            log_factorial_array([3, -1])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_array(self):
+        values = numpy.array(SAMPLES, dtype=numpy.int64)
+        result = log_factorial_array(values)
+        self.assertIsInstance(result, numpy.ndarray)
+        self.assertEqual(result.dtype, numpy.float64)
+        for n, value in zip(SAMPLES, result.tolist()):
+            self.assertCloseToLgamma(n, value)
+        self.assertEqual(log_factorial_array(values.reshape(3, 4)).shape, (3, 4))
+        self.assertEqual(log_factorial_array(numpy.array([], dtype=numpy.uint32)).size, 0)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_rejects_negative_and_non_integers(self):
+        with self.assertRaises(ValueError):
+            log_factorial_array(numpy.array([5, -1]))
+        for values in (numpy.array([1.5, 300.7]), numpy.array([True, False])):
+            with self.assertRaises(TypeError):
+                log_factorial_array(values)
+
+
+if __name__ == "__main__":
+    unittest.main()
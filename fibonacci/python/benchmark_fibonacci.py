@@ -0,0 +1,71 @@
+import argparse
+import time
+
+from fibonacci import (
+    FibonacciCache,
+    fibonacci_fast_doubling,
+    fibonacci_fast_doubling_iterative,
+    fibonacci_iterative,
+    fibonacci_matrix,
+    fibonacci_memoization,
+    fibonacci_recursive,
+)
+
+
+def _memoization_cold(n):
+    # Use a fresh cache so every run measures a cold computation
+    return fibonacci_memoization(n, FibonacciCache(maxsize=2))
+
+
+# Method name -> (function, is it O(n) or worse?)
+# Slow methods are skipped above their size limit (shown as "-")
+METHODS = {
+    "Recursive": (fibonacci_recursive, "exponential"),
+    "Iterative": (fibonacci_iterative, "linear"),
+    "Memoization": (_memoization_cold, "linear"),
+    "Matrix Exp.": (fibonacci_matrix, "log"),
+    "Fast Doubling": (fibonacci_fast_doubling, "log"),
+    "Iterative Fast Doubling": (fibonacci_fast_doubling_iterative, "log"),
+}
+
+# Largest n the recursive method is run for
+RECURSIVE_LIMIT = 25
+
+
+def time_call(func, n, repeat):
+    # Best of `repeat` runs, in seconds
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(n)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(exponents, repeat, max_linear):
+    limits = {"exponential": RECURSIVE_LIMIT, "linear": max_linear, "log": float("inf")}
+    header = f"{'Method':<26}" + "".join(f"{'n=10^%d' % e:>12}" for e in exponents)
+    print(header)
+    print("-" * len(header))
+    for name, (func, growth) in METHODS.items():
+        row = f"{name:<26}"
+        for n in (10 ** e for e in exponents):
+            if n > limits[growth]:
+                row += f"{'-':>12}"
+            else:
+                row += f"{time_call(func, n, repeat) * 1000:>10.2f}ms"
+        print(row)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Fibonacci implementations.")
+    parser.add_argument("--min-exp", type=int, default=3, help="smallest n is 10^min-exp (default: 3)")
+    parser.add_argument("--max-exp", type=int, default=7, help="largest n is 10^max-exp (default: 7)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement, best is kept (default: 3)")
+    parser.add_argument("--max-linear", type=int, default=10 ** 5,
+                        help="largest n for the O(n) methods (default: 10^5)")
+    args = parser.parse_args()
+
+    exponents = range(args.min_exp, args.max_exp + 1)
+    print("⏱️ Fibonacci Benchmark (best of %d runs)\n" % args.repeat)
+    run(exponents, args.repeat, args.max_linear)
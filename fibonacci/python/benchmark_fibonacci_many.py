@@ -0,0 +1,55 @@
+import argparse
+import random
+import time
+
+from fibonacci import (
+    fibonacci_fast_doubling,
+    fibonacci_fast_doubling_iterative,
+    fibonacci_iterative,
+    fibonacci_many,
+    fibonacci_matrix,
+)
+
+
+def time_call(func, repeat):
+    # Best of `repeat` runs, in seconds
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(label, ns, loop_methods, repeat):
+    print(f"\n📦 {label}: {len(ns)} queries, n in [{min(ns)}, {max(ns)}]")
+    print(f"{'Method':<44}{'Time':>12}")
+    print("-" * 56)
+    timings = {"fibonacci_many(ns)": time_call(lambda: fibonacci_many(ns), repeat)}
+    for name, func in loop_methods.items():
+        timings[f"loop over {name}"] = time_call(lambda: [func(n) for n in ns], repeat)
+    for name, seconds in timings.items():
+        print(f"{name:<44}{seconds * 1000:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark fibonacci_many against per-n loops.")
+    parser.add_argument("--queries", type=int, default=1000, help="queries per batch (default: 1000)")
+    parser.add_argument("--low", type=int, default=10 ** 4, help="smallest n in the large batch (default: 10^4)")
+    parser.add_argument("--spread", type=int, default=10 ** 4, help="range of n in the large batch (default: 10^4)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement, best is kept (default: 3)")
+    parser.add_argument("--seed", type=int, default=42, help="random seed (default: 42)")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print("⏱️ fibonacci_many Benchmark (best of %d runs)" % args.repeat)
+
+    small = [rng.randint(0, 92) for _ in range(args.queries)]
+    run("Small n (int64 table)", small, {"fibonacci_iterative": fibonacci_iterative}, args.repeat)
+
+    large = [rng.randint(args.low, args.low + args.spread) for _ in range(args.queries)]
+    run("Large n", large, {
+        "fibonacci_matrix": fibonacci_matrix,
+        "fibonacci_fast_doubling": fibonacci_fast_doubling,
+        "fibonacci_fast_doubling_iterative": fibonacci_fast_doubling_iterative,
+    }, args.repeat)
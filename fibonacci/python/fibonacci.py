@@ -1,3 +1,10 @@
+import math
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+
 # 1. Recursive Method
 def fibonacci_recursive(n):
     # Base case: if n is less than or equal to 0, return 0
@@ -29,20 +36,149 @@ def fibonacci_iterative(n):
 
 
 # 3. Memoization Method
-def fibonacci_memoization(n, memo={}):
-    # Check if the result is already computed and stored in memo
-    if n in memo:
-        return memo[n]
+class FibonacciCache:
+    # Bounded LRU cache for Fibonacci values.
+    #
+    # The cache can be limited by number of entries (maxsize), by the total
+    # size of the stored integers in bytes (max_bytes), or both. When a limit
+    # is exceeded the least recently used entries are evicted first.
+    #
+    # Reads never wait for writers: a lookup is a plain dict access, and the
+    # recency update is skipped when another thread currently holds the lock.
+    # Writes and evictions are serialized by the lock; the hit/miss counters
+    # have their own lock, held only for the increment.
+    def __init__(self, maxsize=1024, max_bytes=None):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be non-negative or None")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative or None")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()  # key -> value, oldest first
+        self._bytes = 0             # total sys.getsizeof() of stored values
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, n):
+        return n in self._data
+
+    @property
+    def nbytes(self):
+        # Approximate memory held by the cached values
+        return self._bytes
+
+    def get(self, n, default=None):
+        # Lock-free lookup that updates the hit/miss counters
+        value = self._data.get(n)
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if value is None:
+            return default
+        # Mark as recently used only if nobody else is writing right now
+        if self._lock.acquire(blocking=False):
+            try:
+                if n in self._data:
+                    self._data.move_to_end(n)
+            finally:
+                self._lock.release()
+        return value
+
+    def peek(self, n, default=None):
+        # Lookup without touching the counters or the LRU order
+        return self._data.get(n, default)
+
+    def put(self, n, value):
+        size = sys.getsizeof(value)
+        with self._lock:
+            old = self._data.pop(n, None)
+            if old is not None:
+                self._bytes -= sys.getsizeof(old)
+            # Values larger than the whole budget are never stored
+            if self.maxsize == 0 or (self.max_bytes is not None and size > self.max_bytes):
+                return
+            self._data[n] = value
+            self._bytes += size
+            # Evict least recently used entries until both limits hold
+            while (self.maxsize is not None and len(self._data) > self.maxsize) or \
+                    (self.max_bytes is not None and self._bytes > self.max_bytes):
+                _, evicted = self._data.popitem(last=False)
+                self._bytes -= sys.getsizeof(evicted)
+
+    def clear(self):
+        # Drop every cached value and reset the counters
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            with self._stats_lock:
+                self.hits = 0
+                self.misses = 0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "nbytes": self._bytes,
+            "maxsize": self.maxsize,
+            "max_bytes": self.max_bytes,
+        }
+
+
+# Byte budget of the shared cache used when the caller does not pass one
+MEMO_CACHE_BYTES = 4 << 20
+# A cold computation keeps a checkpoint pair (F(i-1), F(i)) only at multiples
+# of this step (or of a larger power of two, so at most 16 pairs per call)
+MEMO_CHECKPOINT_STEP = 256
+
+_memo_cache = FibonacciCache(maxsize=1024, max_bytes=MEMO_CACHE_BYTES)
+
+
+def fibonacci_memoization(n, cache=None):
+    # Use the module-level cache unless the caller supplies its own
+    if cache is None:
+        cache = _memo_cache
     # Base case: if n is less than or equal to 0, return 0
     if n <= 0:
         return 0
     # Base case: if n is 1, return 1
     elif n == 1:
         return 1
-    
-    # Store the result in memo to avoid redundant calculations
-    memo[n] = fibonacci_memoization(n - 1, memo) + fibonacci_memoization(n - 2, memo)
-    return memo[n]  # Return the nth Fibonacci number
+
+    # Check if the result is already computed and stored in the cache
+    value = cache.get(n)
+    if value is not None:
+        return value
+
+    # Start from the closest pair (F(k - 1), F(k)) we already know: the two
+    # previous results, or else the highest checkpoint pair below n
+    k = n - 1
+    if cache.peek(k) is None or cache.peek(k - 1) is None:
+        k = (n - 1) // MEMO_CHECKPOINT_STEP * MEMO_CHECKPOINT_STEP
+        while k > 1 and (cache.peek(k) is None or cache.peek(k - 1) is None):
+            k -= MEMO_CHECKPOINT_STEP
+    if k > 1:
+        a, b = cache.peek(k - 1), cache.peek(k)  # F(k - 1), F(k)
+    else:
+        k, a, b = 1, 0, 1
+
+    # Build up from F(k) to F(n). Storing every F(i) would flush the whole
+    # cache on one large n, so only sparse checkpoint pairs and the result are kept
+    step = max(MEMO_CHECKPOINT_STEP, 1 << max(0, n.bit_length() - 4))
+    for i in range(k + 1, n + 1):
+        a, b = b, a + b
+        if i % step == 0:
+            cache.put(i - 1, a)
+            cache.put(i, b)
+    cache.put(n, b)
+    return b  # Return the nth Fibonacci number
 
 
 # 4. Matrix Exponentiation Method
@@ -115,11 +251,363 @@ def fibonacci_fast_doubling(n):
     return fast_dbl(n)[0]
 
 
-# Example usage
-n = 10
-print(f"Fibonacci of {n} (Recursive): {fibonacci_recursive(n)}")
-print(f"Fibonacci of {n} (Iterative): {fibonacci_iterative(n)}")
-print(f"Fibonacci of {n} (Memoization): {fibonacci_memoization(n)}")
-print(f"Fibonacci of {n} (Matrix Exp.): {fibonacci_matrix(n)}")
-print(f"Fibonacci of {n} (Fast Doubling): {fibonacci_fast_doubling(n)}")
+# 6. Iterative Fast Doubling Method (Lucas numbers)
+def _fibonacci_lucas(n):
+    # Returns the pair (F(n), L(n)) where L is the Lucas sequence
+    if n <= 0:
+        return 0, 2
+
+    # Track the pair (F(k), L(k)), starting at k = 1
+    f, l = 1, 1
+    # sign holds (-1)^k for the current k
+    sign = -1
+
+    # Walk the bits of n from the top, skipping the leading 1 (that is k = 1)
+    for bit in bin(n)[3:]:
+        # Double k using:
+        # F(2k) = F(k) * L(k)
+        # L(2k) = L(k)^2 - 2 * (-1)^k
+        # Only two big multiplications per bit, and no lists are allocated
+        f, l = f * l, l * l - 2 * sign
+        sign = 1
+
+        # If the bit is set, step from k to k + 1 using:
+        # F(k + 1) = (F(k) + L(k)) / 2
+        # L(k + 1) = (5 * F(k) + L(k)) / 2
+        if bit == "1":
+            f, l = (f + l) >> 1, (5 * f + l) >> 1
+            sign = -1
+
+    return f, l
+
+
+def fibonacci_fast_doubling_iterative(n):
+    # Base case: Fibonacci of 0 is 0
+    if n <= 0:
+        return 0
+    # The first value of the pair (F(n), L(n)) is F(n)
+    return _fibonacci_lucas(n)[0]
+
+
+# 7. Modular Method (F(n) mod m with Pisano periods)
+# Moduli above this bound are never factored; n is then used without reduction
+PISANO_MAX_MODULUS = 10 ** 12
+
+
+def _fibonacci_pair_mod(n, m):
+    # Iterative fast doubling that returns (F(n) mod m, F(n+1) mod m)
+    # Every intermediate value is reduced, so numbers never grow past m^2
+    a, b = 0, 1 % m
+    for bit in bin(n)[2:]:
+        # F(2k) = F(k) * [2*F(k+1) - F(k)]
+        # F(2k + 1) = F(k+1)^2 + F(k)^2
+        a, b = a * (2 * b - a) % m, (a * a + b * b) % m
+        if bit == "1":
+            a, b = b, (a + b) % m
+    return a, b
+
+
+def _prime_factors(n):
+    # Trial division; returns {prime: exponent}
+    factors = {}
+    d = 2
+    while d * d <= n:
+        while n % d == 0:
+            factors[d] = factors.get(d, 0) + 1
+            n //= d
+        d += 1 if d == 2 else 2
+    if n > 1:
+        factors[n] = factors.get(n, 0) + 1
+    return factors
+
+
+def _pisano_prime(p):
+    # Pisano period of a prime p
+    if p == 2:
+        return 3
+    if p == 5:
+        return 20
+    # pi(p) divides p - 1 when p = +-1 (mod 5), and 2(p + 1) when p = +-2 (mod 5)
+    period = p - 1 if p % 5 in (1, 4) else 2 * (p + 1)
+    # Strip prime factors while the smaller value is still a period
+    for q in _prime_factors(period):
+        while period % q == 0 and _fibonacci_pair_mod(period // q, p) == (0, 1):
+            period //= q
+    return period
+
+
+# Periods already computed, and for moduli not factored yet, the doubling
+# steps that reducing n would have saved so far (both bounded LRU caches)
+_pisano_periods = FibonacciCache(maxsize=1024)
+_pisano_savings = FibonacciCache(maxsize=1024)
+
+
+def pisano_period(m):
+    # Period of the Fibonacci sequence modulo m, cached per modulus
+    if m < 1:
+        raise ValueError("modulus must be a positive integer")
+    if m == 1:
+        return 1
+    period = _pisano_periods.peek(m)
+    if period is None:
+        # pi(m) = lcm(pi(p^e)) over the prime powers of m, and pi(p^e) = p^(e-1) * pi(p)
+        period = 1
+        for p, e in _prime_factors(m).items():
+            period = math.lcm(period, p ** (e - 1) * _pisano_prime(p))
+        _pisano_periods.put(m, period)
+    return period
+
 
+def _pisano_saving(n, m):
+    # pi(m) <= 6m, so reducing n saves about bits(n) - bits(6m) doubling steps
+    if n <= 0:
+        return 0
+    return max(0, n.bit_length() - (6 * m).bit_length())
+
+
+def _pisano_for(m, saving):
+    # Period to reduce by, or None to use n as is.
+    # A cached period is always used. Otherwise m is factored only once the
+    # savings of all its queries so far outweigh the factoring: up to sqrt(m) / 2
+    # divisions, each several times cheaper than a doubling step. A one-off
+    # query never pays for factoring; repeated queries soon reduce for free.
+    period = _pisano_periods.peek(m)
+    if period is not None or not 1 < m <= PISANO_MAX_MODULUS:
+        return period
+    saving += _pisano_savings.peek(m, 0)
+    if saving <= math.isqrt(m) // 4:
+        _pisano_savings.put(m, saving)
+        return None
+    return pisano_period(m)
+
+
+def fibonacci_mod(n, m):
+    # F(n) mod m without ever building the full F(n)
+    if m < 1:
+        raise ValueError("modulus must be a positive integer")
+    if n <= 0 or m == 1:
+        return 0
+    # F(n) mod m repeats with the Pisano period; shrink n before the work
+    period = _pisano_for(m, _pisano_saving(n, m))
+    if period is not None:
+        n %= period
+    return _fibonacci_pair_mod(n, m)[0]
+
+
+def fibonacci_mod_many(queries):
+    # Answer many (n, m) pairs, returned in input order
+    # Queries are grouped by modulus so each period is computed at most once
+    groups = {}
+    for index, (n, m) in enumerate(queries):
+        if m < 1:
+            raise ValueError("modulus must be a positive integer")
+        groups.setdefault(m, []).append(index)
+
+    results = [0] * len(queries)
+    for m, indexes in groups.items():
+        if m == 1:
+            continue
+        # The whole group's saving is weighed against factoring m once
+        period = _pisano_for(m, sum(_pisano_saving(queries[index][0], m) for index in indexes))
+        for index in indexes:
+            n = queries[index][0]
+            if n <= 0:
+                continue
+            if period is not None:
+                n %= period
+            results[index] = _fibonacci_pair_mod(n, m)[0]
+    return results
+
+
+# 8. Batch Method (many n at once)
+# F(92) is the largest Fibonacci number that fits in a signed 64-bit integer
+INT64_FIBONACCI_LIMIT = 92
+# Gaps up to this size are covered by plain additions
+BATCH_STEP_LIMIT = 64
+
+_int64_table = None
+
+
+def _int64_fibonacci_table():
+    # F(0) .. F(92), filled once on first use
+    global _int64_table
+    if _int64_table is None:
+        table = [0, 1]
+        for _ in range(2, INT64_FIBONACCI_LIMIT + 1):
+            table.append(table[-1] + table[-2])
+        _int64_table = table
+    return _int64_table
+
+
+def _fibonacci_pair(n):
+    # (F(n), F(n+1)) from the Lucas pair: F(n+1) = (F(n) + L(n)) / 2
+    f, l = _fibonacci_lucas(n)
+    return f, (f + l) >> 1
+
+
+def fibonacci_many(ns):
+    # F(n) for every n in ns, returned in input order
+    # NumPy integer arrays whose values all fit in int64 are answered with one vectorized lookup
+    if type(ns).__module__ == "numpy":
+        np = sys.modules["numpy"]
+        values = np.asarray(ns)
+        if values.dtype.kind in "iu" and (values.size == 0 or values.max() <= INT64_FIBONACCI_LIMIT):
+            table = np.array(_int64_fibonacci_table(), dtype=np.int64)
+            return table[np.maximum(values, 0)]
+        ns = values.tolist()
+
+    ns = list(ns)
+    results = [0] * len(ns)
+    table = _int64_fibonacci_table()
+
+    # Small n come straight from the table; the rest are handled in sorted order
+    large = []
+    for index, n in enumerate(ns):
+        if n <= INT64_FIBONACCI_LIMIT:
+            results[index] = table[max(n, 0)]
+        else:
+            large.append(index)
+    large.sort(key=ns.__getitem__)
+
+    # (k, F(k), F(k+1)) of the previous query, reused for the next one
+    k, a, b = None, 0, 1
+    for index in large:
+        n = ns[index]
+        gap = n - k if k is not None else n
+        if k is None or gap > k >> 2:
+            # Nothing close enough to reuse: compute from scratch
+            a, b = _fibonacci_pair(n)
+        elif gap <= BATCH_STEP_LIMIT:
+            # Very close: just keep adding
+            for _ in range(gap):
+                a, b = b, a + b
+        elif gap > 0:
+            # Jump ahead with the addition formulas:
+            # F(k + d) = F(k+1) * F(d) + F(k) * F(d-1)
+            # F(k + d + 1) = F(k+1) * F(d+1) + F(k) * F(d)
+            # F(d) is much smaller than F(k), so this is cheaper than starting over
+            fd, fd1 = _fibonacci_pair(gap)
+            a, b = b * fd + a * (fd1 - fd), b * fd1 + a * fd
+        k = n
+        results[index] = a
+    return results
+
+
+# 9. Automatic Method Selection
+# Thresholds used by fibonacci(n) when no calibration file exists
+DEFAULT_FIBONACCI_THRESHOLDS = {
+    # n <= table_limit is read from the precomputed table (at most 92)
+    "table_limit": INT64_FIBONACCI_LIMIT,
+    # table_limit < n <= iterative_limit uses the simple loop, larger n use fast doubling
+    # (calibrate_fibonacci() measures it; on typical machines fast doubling already wins past the table)
+    "iterative_limit": INT64_FIBONACCI_LIMIT,
+}
+# Written by calibrate_fibonacci() and read on the first call to fibonacci(n)
+FIBONACCI_THRESHOLDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fibonacci_thresholds.json")
+
+_thresholds = None
+
+
+def load_fibonacci_thresholds(path=None):
+    # Read the crossover thresholds from the config file, falling back to the defaults
+    # (with a warning) when the file is unreadable or holds invalid values
+    global _thresholds
+    import json
+
+    thresholds = dict(DEFAULT_FIBONACCI_THRESHOLDS)
+    path = path or FIBONACCI_THRESHOLDS_PATH
+    try:
+        with open(path) as config:
+            saved = json.load(config)
+        if not isinstance(saved, dict):
+            raise ValueError("expected a JSON object")
+        for key in thresholds:
+            if key in saved:
+                thresholds[key] = int(saved[key])
+        # The table only holds values that fit in int64, and the loop takes over where it ends
+        if not 0 <= thresholds["table_limit"] <= INT64_FIBONACCI_LIMIT:
+            raise ValueError(f"table_limit must be in [0, {INT64_FIBONACCI_LIMIT}]")
+        if thresholds["iterative_limit"] < thresholds["table_limit"]:
+            raise ValueError("iterative_limit must be >= table_limit")
+    except FileNotFoundError:
+        thresholds = dict(DEFAULT_FIBONACCI_THRESHOLDS)
+    except (OSError, ValueError, TypeError) as error:
+        import warnings
+
+        warnings.warn(f"ignoring invalid Fibonacci thresholds in {path}: {error}", RuntimeWarning)
+        thresholds = dict(DEFAULT_FIBONACCI_THRESHOLDS)
+    _thresholds = thresholds
+    return thresholds
+
+
+def _best_of(func, n, number, repeat):
+    # Fastest average time of `number` calls, over `repeat` rounds
+    import timeit
+
+    return min(timeit.repeat(lambda: func(n), number=number, repeat=repeat)) / number
+
+
+def calibrate_fibonacci(path=None, save=True, max_n=4096, number=200, repeat=5):
+    # Measure where fast doubling starts beating the loop on this machine,
+    # optionally save the result, and start using it right away.
+    # A table lookup costs the same for every n, so the table is used up to its
+    # end (F(92), the int64 limit) and only n above it are benchmarked.
+    table_limit = INT64_FIBONACCI_LIMIT
+
+    def doubling_wins(n):
+        return _best_of(fibonacci_fast_doubling_iterative, n, number, repeat) < \
+            _best_of(fibonacci_iterative, n, number, repeat)
+
+    # Double n (up to max_n) until fast doubling wins, then binary search the
+    # crossover; iterative_limit == table_limit means the loop never wins above
+    # the table. The bisection only starts from a high that was measured to win.
+    low, high = table_limit, table_limit + 1
+    while not doubling_wins(high):
+        if high >= max_n:
+            # Fast doubling never won up to max_n: keep the loop up to there
+            low = high = max(max_n, table_limit)
+            break
+        low, high = high, min(2 * high, max_n)
+    while high - low > 1:
+        mid = (low + high) // 2
+        if doubling_wins(mid):
+            high = mid
+        else:
+            low = mid
+
+    thresholds = {"table_limit": table_limit, "iterative_limit": low}
+    if save:
+        import json
+
+        with open(path or FIBONACCI_THRESHOLDS_PATH, "w") as config:
+            json.dump(thresholds, config, indent=2)
+            config.write("\n")
+
+    global _thresholds
+    _thresholds = thresholds
+    return thresholds
+
+
+def fibonacci(n):
+    # Single entry point that picks the cheapest method for the size of n
+    thresholds = _thresholds or load_fibonacci_thresholds()
+    if n <= 0:
+        return 0
+    if n <= thresholds["table_limit"]:
+        return _int64_fibonacci_table()[n]
+    if n <= thresholds["iterative_limit"]:
+        return fibonacci_iterative(n)
+    return _fibonacci_lucas(n)[0]
+
+
+# Example usage
+if __name__ == "__main__":
+    n = 10
+    print(f"Fibonacci of {n} (Recursive): {fibonacci_recursive(n)}")
+    print(f"Fibonacci of {n} (Iterative): {fibonacci_iterative(n)}")
+    print(f"Fibonacci of {n} (Memoization): {fibonacci_memoization(n)}")
+    print(f"Fibonacci of {n} (Matrix Exp.): {fibonacci_matrix(n)}")
+    print(f"Fibonacci of {n} (Fast Doubling): {fibonacci_fast_doubling(n)}")
+    print(f"Fibonacci of {n} (Iterative Fast Doubling): {fibonacci_fast_doubling_iterative(n)}")
+    print(f"Fibonacci of {n} mod 7 (Modular): {fibonacci_mod(n, 7)}")
+    print(f"Fibonacci of {n} (Automatic): {fibonacci(n)}")
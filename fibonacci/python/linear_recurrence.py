@@ -0,0 +1,164 @@
+# Linear recurrences of any order k (Kitamasa's method)
+#
+# a(n) = c1 * a(n-1) + c2 * a(n-2) + ... + ck * a(n-k)
+#
+# fibonacci_matrix raises a 2x2 matrix to the n-th power. The same idea works
+# for any order k with a k x k companion matrix, but every matrix product then
+# costs O(k^3). Kitamasa's method works with polynomials instead: a(n) is a
+# linear combination of a(0) .. a(k-1), and the weights are the coefficients
+# of x^n mod P(x), where P(x) = x^k - c1 * x^(k-1) - ... - ck is the
+# characteristic polynomial. Each polynomial product costs O(k^2), so a term
+# costs O(k^2 log n). With a modulus, products and reductions are done as
+# single big-integer multiplications, which is faster still for large k.
+
+
+class LinearRecurrence:
+    # coefficients: [c1, c2, ..., ck]
+    # initial: [a(0), a(1), ..., a(k-1)]
+    # modulus: optional; when given every term is returned modulo it
+    def __init__(self, coefficients, initial, modulus=None):
+        if len(coefficients) == 0:
+            raise ValueError("coefficients must not be empty")
+        if len(coefficients) != len(initial):
+            raise ValueError("need exactly one initial value per coefficient")
+        if modulus is not None and modulus < 1:
+            raise ValueError("modulus must be a positive integer")
+
+        self.order = len(coefficients)
+        self.modulus = modulus
+        if modulus is None:
+            self.coefficients = list(coefficients)
+            self.initial = list(initial)
+        else:
+            self.coefficients = [c % modulus for c in coefficients]
+            self.initial = [a % modulus for a in initial]
+
+        # x^k = c1 * x^(k-1) + ... + ck, stored lowest power first
+        self._reduction = self.coefficients[::-1]
+        # _powers[i] holds x^(2^i) mod P(x), grown on demand and shared by all queries
+        self._powers = []
+        # Power series 1 / (1 - c1 * x - ... - ck * x^k), used to reduce with multiplications
+        self._inverse = self._inverse_series(self.order) if modulus is not None else None
+
+    def _inverse_series(self, length):
+        # s(0) = 1, s(i) = c1 * s(i-1) + ... + ck * s(i-k), modulo m
+        m = self.modulus
+        c = self.coefficients
+        s = [1 % m]
+        for i in range(1, length):
+            s.append(sum(c[j - 1] * s[i - j] for j in range(1, min(i, self.order) + 1)) % m)
+        return s
+
+    def _multiply(self, p, q):
+        # Product of two polynomials of degree < k (lowest power first)
+        if self.modulus is not None:
+            return self._multiply_packed(p, q)
+
+        result = [0] * (len(p) + len(q) - 1)
+        for i, coef in enumerate(p):
+            if coef:
+                # Add coef * q into result[i : i + len(q)] in one pass
+                result[i:i + len(q)] = [r + coef * x for r, x in zip(result[i:i + len(q)], q)]
+        return result
+
+    def _multiply_packed(self, p, q):
+        # Kronecker substitution: pack each polynomial into one big integer,
+        # multiply once (Python uses Karatsuba for big ints), then unpack.
+        # All coefficients are in [0, modulus), so no slot can overflow.
+        m = self.modulus
+        bits = 2 * (m - 1).bit_length() + max(len(p), len(q)).bit_length() + 1
+        width = (bits + 7) // 8
+        a = int.from_bytes(b"".join(c.to_bytes(width, "little") for c in p), "little")
+        b = int.from_bytes(b"".join(c.to_bytes(width, "little") for c in q), "little")
+        size = len(p) + len(q) - 1
+        raw = (a * b).to_bytes(size * width, "little")
+        return [int.from_bytes(raw[i:i + width], "little") for i in range(0, size * width, width)]
+
+    def _reduce(self, poly):
+        # Reduce a polynomial modulo P(x), leaving exactly k coefficients
+        k = self.order
+        if len(poly) <= k:
+            if self.modulus is not None:
+                poly = [r % self.modulus for r in poly]
+            return poly + [0] * (k - len(poly))
+        if self.modulus is not None:
+            return self._reduce_packed(poly)
+
+        c = self._reduction
+        # Replace x^i (i >= k) with c1 * x^(i-1) + ... + ck * x^(i-k), from the top down
+        for i in range(len(poly) - 1, k - 1, -1):
+            coef = poly[i]
+            if coef:
+                poly[i - k:i] = [r + coef * x for r, x in zip(poly[i - k:i], c)]
+        return poly[:k]
+
+    def _reduce_packed(self, poly):
+        # Division by the monic P(x) through multiplication by its reversed inverse:
+        # the reversed quotient is reverse(poly) * inverse, truncated, and then
+        # poly mod P = poly[:k] + (quotient * (c1 * x^(k-1) + ... + ck))[:k]
+        k = self.order
+        m = self.modulus
+        poly = [r % m for r in poly]
+        size = len(poly) - k
+        quotient = self._multiply_packed(poly[:k - 1:-1], self._inverse[:size])[:size]
+        quotient = [q % m for q in reversed(quotient)]
+        correction = self._multiply_packed(quotient, self._reduction)
+        return [(r + x) % m for r, x in zip(poly[:k], correction + [0] * k)]
+
+    def _power_of_two(self, i):
+        # x^(2^i) mod P(x)
+        while len(self._powers) <= i:
+            if not self._powers:
+                # x^1, reduced in case k == 1
+                base = self._reduce([0, 1])
+            else:
+                last = self._powers[-1]
+                base = self._reduce(self._multiply(last, last))
+            self._powers.append(base)
+        return self._powers[i]
+
+    def _combine(self, weights):
+        # a(n) = sum of weights[i] * a(i)
+        total = sum(w * a for w, a in zip(weights, self.initial))
+        return total % self.modulus if self.modulus is not None else total
+
+    def term(self, n):
+        # The n-th term a(n), n >= 0
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if n < self.order:
+            return self.initial[n] if self.modulus is None else self.initial[n] % self.modulus
+
+        # Multiply together x^(2^i) for every set bit i of n
+        result = None
+        i = 0
+        while n:
+            if n & 1:
+                power = self._power_of_two(i)
+                result = power if result is None else self._reduce(self._multiply(result, power))
+            n >>= 1
+            i += 1
+        return self._combine(result)
+
+    def terms(self, ns):
+        # a(n) for every n in ns, in input order
+        # The table of x^(2^i) is built once and reused by every query
+        return [self.term(n) for n in ns]
+
+
+def linear_recurrence(coefficients, initial, n, modulus=None):
+    # One-off helper: the n-th term of the recurrence
+    return LinearRecurrence(coefficients, initial, modulus).term(n)
+
+
+def tribonacci(n, modulus=None):
+    # T(0) = 0, T(1) = 0, T(2) = 1, T(n) = T(n-1) + T(n-2) + T(n-3)
+    return linear_recurrence([1, 1, 1], [0, 0, 1], n, modulus)
+
+
+# Example usage
+if __name__ == "__main__":
+    fib = LinearRecurrence([1, 1], [0, 1])
+    print("Fibonacci F(0..10):", fib.terms(range(11)))
+    print("Tribonacci T(0..10):", [tribonacci(n) for n in range(11)])
+    print("Tribonacci T(10^18) mod 1e9+7:", tribonacci(10 ** 18, 10 ** 9 + 7))
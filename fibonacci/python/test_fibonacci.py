@@ -0,0 +1,311 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+import warnings
+from unittest import mock
+
+import fibonacci
+from linear_recurrence import LinearRecurrence, linear_recurrence, tribonacci
+
+
+class TestFibonacciCache(unittest.TestCase):
+
+    def test_evicts_least_recently_used(self):
+        cache = fibonacci.FibonacciCache(maxsize=3)
+        for n in (1, 2, 3):
+            cache.put(n, n)
+        cache.get(1)       # 2 is now the oldest
+        cache.peek(2)      # peek does not refresh it
+        cache.put(4, 4)
+        self.assertNotIn(2, cache)
+        self.assertEqual([n for n in (1, 3, 4) if n in cache], [1, 3, 4])
+        cache.put(5, 5)
+        self.assertNotIn(3, cache)
+        self.assertEqual(len(cache), 3)
+
+    def test_byte_budget(self):
+        small, large = fibonacci.fibonacci_iterative(10), fibonacci.fibonacci_iterative(5000)
+        budget = 2 * sys.getsizeof(small)
+        cache = fibonacci.FibonacciCache(maxsize=None, max_bytes=budget)
+        # A value larger than the whole budget is never stored
+        cache.put(5000, large)
+        self.assertNotIn(5000, cache)
+        self.assertEqual(cache.nbytes, 0)
+        for n in range(10, 13):
+            cache.put(n, fibonacci.fibonacci_iterative(n))
+        self.assertLessEqual(cache.nbytes, budget)
+        self.assertNotIn(10, cache)
+        self.assertEqual(cache.nbytes, sum(sys.getsizeof(cache.peek(n)) for n in (11, 12)))
+
+    def test_counters_and_clear(self):
+        cache = fibonacci.FibonacciCache()
+        self.assertEqual(fibonacci.fibonacci_memoization(50, cache), fibonacci.fibonacci_iterative(50))
+        misses = cache.misses
+        self.assertEqual(fibonacci.fibonacci_memoization(50, cache), fibonacci.fibonacci_iterative(50))
+        self.assertEqual((cache.hits, cache.misses), (1, misses))
+        self.assertIsNone(cache.get(1000))
+        self.assertEqual(cache.stats()["misses"], misses + 1)
+        cache.clear()
+        self.assertEqual(cache.stats(), {"hits": 0, "misses": 0, "size": 0, "nbytes": 0,
+                                         "maxsize": 1024, "max_bytes": None})
+
+    def test_large_cold_call_keeps_other_entries(self):
+        cache = fibonacci.FibonacciCache(maxsize=64)
+        for n in range(10, 20):
+            cache.put(n, fibonacci.fibonacci_iterative(n))
+        self.assertEqual(fibonacci.fibonacci_memoization(50000, cache), fibonacci.fibonacci_iterative(50000))
+        # Only the result and at most 16 checkpoint pairs are stored
+        self.assertLessEqual(len(cache), 10 + 1 + 2 * 16)
+        self.assertTrue(all(n in cache for n in range(10, 20)))
+        # A later n reuses a checkpoint pair instead of starting from F(1)
+        with mock.patch.object(cache, "put", wraps=cache.put) as put:
+            self.assertEqual(fibonacci.fibonacci_memoization(49999, cache), fibonacci.fibonacci_iterative(49999))
+        self.assertEqual(put.call_count, 1)
+
+    def test_shared_cache_has_a_byte_budget(self):
+        self.assertEqual(fibonacci._memo_cache.max_bytes, fibonacci.MEMO_CACHE_BYTES)
+
+    def test_counters_are_exact_under_threads(self):
+        cache = fibonacci.FibonacciCache()
+        cache.put(5, 5)
+
+        def worker():
+            for i in range(20000):
+                cache.get(5 if i % 2 else 6)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual((cache.hits, cache.misses), (80000, 80000))
+
+    def test_limits_must_be_non_negative(self):
+        with self.assertRaises(ValueError):
+            fibonacci.FibonacciCache(maxsize=-1)
+        with self.assertRaises(ValueError):
+            fibonacci.FibonacciCache(max_bytes=-1)
+
+    def test_concurrent_use(self):
+        cache = fibonacci.FibonacciCache(maxsize=64)
+        errors = []
+
+        def worker(offset):
+            try:
+                for n in range(offset, offset + 300):
+                    if fibonacci.fibonacci_memoization(n, cache) != fibonacci.fibonacci_iterative(n):
+                        errors.append(n)
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=worker, args=(i * 7,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(cache), 64)
+        self.assertEqual(cache.nbytes, sum(sys.getsizeof(cache.peek(n)) for n in list(cache._data)))
+
+
+class TestFastDoublingIterative(unittest.TestCase):
+
+    def test_matches_iterative(self):
+        ns = [-5, -1, 0, 1, 2, 3]
+        for e in range(2, 14):
+            ns += [(1 << e) - 1, 1 << e, (1 << e) + 1]
+        ns += [10 ** 4 + 7, 12345]
+        for n in ns:
+            with self.subTest(n=n):
+                self.assertEqual(fibonacci.fibonacci_fast_doubling_iterative(n), fibonacci.fibonacci_iterative(n))
+
+    def test_matches_recursive_fast_doubling(self):
+        for n in (1 << 17, (1 << 17) + 3, 10 ** 5):
+            self.assertEqual(fibonacci.fibonacci_fast_doubling_iterative(n), fibonacci.fibonacci_fast_doubling(n))
+
+
+class TestFibonacciMany(unittest.TestCase):
+
+    def test_matches_iterative(self):
+        ns = [0, -3, 1, 92, 93, 500, 94, 1000, 1001, 1064, 5000, 93, 2, 20000]
+        self.assertEqual(fibonacci.fibonacci_many(ns), [fibonacci.fibonacci_iterative(n) for n in ns])
+
+    def test_accepts_iterables(self):
+        self.assertEqual(fibonacci.fibonacci_many(range(100, 110)),
+                         [fibonacci.fibonacci_iterative(n) for n in range(100, 110)])
+        self.assertEqual(fibonacci.fibonacci_many([]), [])
+
+
+class TestLinearRecurrence(unittest.TestCase):
+
+    def naive(self, coefficients, initial, n):
+        values = list(initial)
+        while len(values) <= n:
+            values.append(sum(c * a for c, a in zip(coefficients, reversed(values[-len(coefficients):]))))
+        return values[n]
+
+    def test_fibonacci(self):
+        fib = LinearRecurrence([1, 1], [0, 1])
+        self.assertEqual(fib.terms(range(300)), [fibonacci.fibonacci_iterative(n) for n in range(300)])
+
+    def test_matches_naive(self):
+        cases = [([1, 1, 1], [0, 0, 1]), ([2, -1, 3, 0, 1], [1, 2, 3, 4, 5]), ([3], [7])]
+        for coefficients, initial in cases:
+            for modulus in (None, 1, 97, 10 ** 9 + 7):
+                recurrence = LinearRecurrence(coefficients, initial, modulus)
+                for n in (0, 1, 4, 5, 17, 64, 129):
+                    with self.subTest(coefficients=coefficients, modulus=modulus, n=n):
+                        expected = self.naive(coefficients, initial, n)
+                        if modulus is not None:
+                            expected %= modulus
+                        self.assertEqual(recurrence.term(n), expected)
+
+    def test_helpers(self):
+        self.assertEqual([tribonacci(n) for n in range(10)], [0, 0, 1, 1, 2, 4, 7, 13, 24, 44])
+        self.assertEqual(tribonacci(1000, 10 ** 9 + 7), self.naive([1, 1, 1], [0, 0, 1], 1000) % (10 ** 9 + 7))
+        self.assertEqual(linear_recurrence([1, 1], [0, 1], 10 ** 18, 10 ** 9 + 7),
+                         fibonacci.fibonacci_mod(10 ** 18, 10 ** 9 + 7))
+
+    def test_invalid_arguments(self):
+        for args in (([], []), ([1, 1], [0]), ([1], [1], 0)):
+            with self.assertRaises(ValueError):
+                LinearRecurrence(*args)
+        with self.assertRaises(ValueError):
+            LinearRecurrence([1], [1]).term(-1)
+
+
+class TestFibonacciThresholds(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "thresholds.json")
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        os.rmdir(self.directory)
+        fibonacci._thresholds = None
+
+    def write(self, text):
+        with open(self.path, "w") as config:
+            config.write(text)
+
+    def test_missing_file_uses_defaults(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            thresholds = fibonacci.load_fibonacci_thresholds(self.path)
+        self.assertEqual(thresholds, fibonacci.DEFAULT_FIBONACCI_THRESHOLDS)
+
+    def test_saved_thresholds_are_used(self):
+        self.write(json.dumps({"table_limit": 50, "iterative_limit": 200}))
+        self.assertEqual(fibonacci.load_fibonacci_thresholds(self.path), {"table_limit": 50, "iterative_limit": 200})
+        self.assertEqual(fibonacci.fibonacci(60), fibonacci.fibonacci_iterative(60))
+
+    def test_invalid_files_fall_back_with_a_warning(self):
+        for text in ("{bad json", "[1, 2]", '{"table_limit": "x"}',
+                     '{"table_limit": 92, "iterative_limit": 5}', '{"table_limit": 500}'):
+            with self.subTest(text=text):
+                self.write(text)
+                with self.assertWarns(RuntimeWarning):
+                    thresholds = fibonacci.load_fibonacci_thresholds(self.path)
+                self.assertEqual(thresholds, fibonacci.DEFAULT_FIBONACCI_THRESHOLDS)
+                self.assertEqual(fibonacci.fibonacci(100), fibonacci.fibonacci_iterative(100))
+
+    def test_calibration_benchmarks_above_the_table(self):
+        thresholds = fibonacci.calibrate_fibonacci(self.path, save=True, max_n=256, number=5, repeat=1)
+        self.assertEqual(thresholds["table_limit"], fibonacci.INT64_FIBONACCI_LIMIT)
+        self.assertGreaterEqual(thresholds["iterative_limit"], thresholds["table_limit"])
+        self.assertEqual(fibonacci.load_fibonacci_thresholds(self.path), thresholds)
+
+    def fake_costs(self, doubling_cost):
+        # The loop costs n, fast doubling a constant: fast doubling wins above doubling_cost
+        def best_of(func, n, number, repeat):
+            return doubling_cost if func is fibonacci.fibonacci_fast_doubling_iterative else n
+        return mock.patch.object(fibonacci, "_best_of", best_of)
+
+    def test_calibration_finds_the_crossover(self):
+        with self.fake_costs(500):
+            thresholds = fibonacci.calibrate_fibonacci(self.path, save=False, max_n=4096)
+        self.assertEqual(thresholds["iterative_limit"], 500)
+
+    def test_calibration_when_doubling_never_wins(self):
+        with self.fake_costs(10 ** 9):
+            thresholds = fibonacci.calibrate_fibonacci(self.path, save=False, max_n=1000)
+        self.assertEqual(thresholds["iterative_limit"], 1000)
+
+    def test_fibonacci_matches_iterative(self):
+        for n in list(range(0, 200)) + [1000, 5000]:
+            self.assertEqual(fibonacci.fibonacci(n), fibonacci.fibonacci_iterative(n))
+
+
+class TestFibonacciMod(unittest.TestCase):
+
+    def setUp(self):
+        fibonacci._pisano_periods.clear()
+        fibonacci._pisano_savings.clear()
+
+    def test_matches_naive(self):
+        for m in (1, 2, 5, 10, 1000, 10 ** 9 + 7, 10 ** 12 + 39):
+            for n in (0, 1, 2, 10, 99, 1000, 4321):
+                with self.subTest(n=n, m=m):
+                    self.assertEqual(fibonacci.fibonacci_mod(n, m), fibonacci.fibonacci_iterative(n) % m)
+
+    def test_pisano_period_matches_naive(self):
+        for m in range(1, 200):
+            a, b, period = 0, 1 % m, 0
+            while True:
+                a, b, period = b, (a + b) % m, period + 1
+                if (a, b) == (0, 1 % m):
+                    break
+            self.assertEqual(fibonacci.pisano_period(m), period)
+
+    def reduced_n(self, n, m):
+        # The n that fibonacci_mod hands to the fast doubling
+        with mock.patch.object(fibonacci, "_fibonacci_pair_mod", wraps=fibonacci._fibonacci_pair_mod) as pair:
+            fibonacci.fibonacci_mod(n, m)
+        return pair.call_args_list[-1].args[0]
+
+    def test_one_off_query_is_not_factored(self):
+        for m in (10 ** 6, 10 ** 9 + 7, 10 ** 12 + 39):
+            self.assertEqual(self.reduced_n(10 ** 18, m), 10 ** 18)
+            self.assertNotIn(m, fibonacci._pisano_periods)
+
+    def test_repeated_queries_reduce(self):
+        for m, repeats in ((10 ** 6, 10), (10 ** 9 + 7, 400)):
+            with self.subTest(m=m):
+                for _ in range(repeats):
+                    fibonacci.fibonacci_mod(10 ** 18, m)
+                self.assertIn(m, fibonacci._pisano_periods)
+                self.assertLess(self.reduced_n(10 ** 18 + 1, m), 6 * m)
+                self.assertEqual(fibonacci.fibonacci_mod(10 ** 18 + 1, m), fibonacci._fibonacci_pair_mod(10 ** 18 + 1, m)[0])
+
+    def test_cached_period_is_always_used(self):
+        period = fibonacci.pisano_period(1000)
+        self.assertEqual(self.reduced_n(period + 5, 1000), 5)
+
+    def test_huge_n_is_reduced_at_once(self):
+        n = 10 ** 5000
+        self.assertLess(self.reduced_n(n, 1000), 6000)
+        self.assertEqual(fibonacci.fibonacci_mod(n, 1000), fibonacci._fibonacci_pair_mod(n, 1000)[0])
+
+    def test_many_weighs_the_group_at_once(self):
+        queries = [(10 ** 18 + i, 10 ** 6) for i in range(10)]
+        self.assertEqual(fibonacci.fibonacci_mod_many(queries),
+                         [fibonacci._fibonacci_pair_mod(n, m)[0] for n, m in queries])
+        self.assertIn(10 ** 6, fibonacci._pisano_periods)
+        fibonacci.fibonacci_mod_many([(10 ** 18, 10 ** 9 + 7)])
+        self.assertNotIn(10 ** 9 + 7, fibonacci._pisano_periods)
+
+    def test_many_matches_single(self):
+        queries = [(10 ** 5000, 1000), (7, 10 ** 12), (5, 1), (0, 7), (123, 1000), (10 ** 40, 97)]
+        expected = [fibonacci.fibonacci_mod(n, m) for n, m in queries]
+        self.assertEqual(fibonacci.fibonacci_mod_many(queries), expected)
+        with self.assertRaises(ValueError):
+            fibonacci.fibonacci_mod_many([(5, 0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import argparse
+import bisect
+import random
+import time
+
+from binary_search import binary_search
+from eytzinger_index import EytzingerIndex
+
+
+def time_queries(search, targets):
+    # Average time per query, in microseconds
+    start = time.perf_counter()
+    for target in targets:
+        search(target)
+    return (time.perf_counter() - start) / len(targets) * 1e6
+
+
+def run(exponents, queries, block_size, seed):
+    rng = random.Random(seed)
+    header = f"{'n':>12}{'binary_search':>16}{'bisect':>12}{'Eytzinger':>12}{'Blocks of %d' % block_size:>14}"
+    print(header)
+    print("-" * len(header))
+    for n in (10 ** e for e in exponents):
+        arr = list(range(0, 2 * n, 2))
+        targets = [rng.randrange(2 * n) for _ in range(queries)]
+        eytzinger = EytzingerIndex(arr)
+        blocks = EytzingerIndex(arr, block_size=block_size)
+        row = f"{n:>12}"
+        row += f"{time_queries(lambda t: binary_search(arr, t), targets):>14.2f}us"
+        row += f"{time_queries(lambda t: bisect.bisect_left(arr, t), targets):>10.2f}us"
+        row += f"{time_queries(eytzinger.search, targets):>10.2f}us"
+        row += f"{time_queries(blocks.search, targets):>12.2f}us"
+        print(row)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark EytzingerIndex against binary_search and bisect.")
+    parser.add_argument("--min-exp", type=int, default=6, help="smallest array is 10^min-exp (default: 6)")
+    parser.add_argument("--max-exp", type=int, default=7,
+                        help="largest array is 10^max-exp (default: 7; 8 needs several GB of RAM)")
+    parser.add_argument("--queries", type=int, default=100000, help="random lookups per size (default: 100000)")
+    parser.add_argument("--block-size", type=int, default=16, help="keys per node of the block layout (default: 16)")
+    parser.add_argument("--seed", type=int, default=42, help="random seed (default: 42)")
+    args = parser.parse_args()
+
+    print("⏱️ Eytzinger Index Benchmark (time per query)\n")
+    run(range(args.min_exp, args.max_exp + 1), args.queries, args.block_size, args.seed)
@@ -1,3 +1,6 @@
+import sys
+
+
 def binary_search(arr, target):
     """
     Performs binary search on a sorted array (iterative version).
@@ -51,6 +54,55 @@ def binary_search_recursive(arr, target, left=0, right=None):
         return binary_search_recursive(arr, target, left, mid - 1)
 
 
+def binary_search_many(arr, targets):
+    """
+    Performs binary search for many targets on the same sorted array.
+
+    The targets are visited in sorted order, so each search starts where the
+    previous one ended and the search window keeps shrinking. NumPy arrays
+    are answered with a single vectorized ``searchsorted`` call.
+
+    Args:
+        arr (list | numpy.ndarray): Sorted list of elements.
+        targets (iterable): Values to search for.
+
+    Returns:
+        list | numpy.ndarray: For each target, in input order, the index of
+        its first occurrence if found; -1 otherwise.
+    """
+    if type(arr).__module__ == "numpy":
+        np = sys.modules["numpy"]
+        targets = np.asarray(targets)
+        n = len(arr)
+        if n == 0:
+            return np.full(targets.shape, -1, dtype=np.intp)
+        positions = np.searchsorted(arr, targets, side="left")
+        found = (positions < n) & (arr[np.minimum(positions, n - 1)] == targets)
+        return np.where(found, positions, -1)
+
+    targets = list(targets)
+    results = [-1] * len(targets)
+    order = sorted(range(len(targets)), key=targets.__getitem__)
+
+    n = len(arr)
+    left = 0  # Every remaining target is >= the previous one, so nothing left of here matters
+    for i in order:
+        target = targets[i]
+        # Lower bound of target in arr[left:]
+        low, high = left, n
+        while low < high:
+            mid = (low + high) // 2
+            if arr[mid] < target:
+                low = mid + 1
+            else:
+                high = mid
+        left = low
+        if low < n and arr[low] == target:
+            results[i] = low
+
+    return results
+
+
 # Example usage and demonstration
 if __name__ == "__main__":
      # Sample sorted data
@@ -73,4 +125,8 @@ if __name__ == "__main__":
     if result_rec != -1:
         print(f"✅ [Recursive] Found {target_value} at index {result_rec}.")
     else:
-        print(f"❌ [Recursive] {target_value} not found.")
\ No newline at end of file
+        print(f"❌ [Recursive] {target_value} not found.")
+
+    # --- Batched Version ---
+    batch = [60, 15, 10, 80]
+    print(f"\n📦 [Batched] Targets {batch} → indices {binary_search_many(data, batch)}")
\ No newline at end of file
@@ -0,0 +1,183 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class EytzingerIndex:
+    """
+    Static search index over a sorted array, stored in a cache-friendly layout.
+
+    ``binary_search`` jumps across the whole array, so on very large arrays
+    almost every probe is a cache miss. This index stores the same keys in
+    breadth-first (Eytzinger) order: the first probes of every query hit the
+    same few cache lines, and the children of a node sit next to each other.
+
+    With ``block_size`` set, the keys are stored in a B-tree-like layout
+    instead: nodes of ``block_size`` consecutive keys with ``block_size + 1``
+    children each. Each node is searched with one ``bisect`` call, and a query
+    visits only log_(B+1) n nodes.
+
+    Keys live in a compact ``array`` buffer, and every query reports positions
+    in the original sorted array. In the Eytzinger layout a key's position is
+    computed from its slot, so no position table is stored; the B-tree-like
+    layout keeps one ``array('q')`` entry per slot.
+    """
+
+    def __init__(self, arr, typecode=None, block_size=None):
+        """
+        Builds the index.
+
+        Args:
+            arr (list): Sorted list of numbers.
+            typecode (str): ``array`` typecode for the keys (default: 'q' for
+                integers, 'd' otherwise).
+            block_size (int): Keys per node for the B-tree-like layout;
+                None (default) uses the Eytzinger layout.
+        """
+        if block_size is not None and block_size < 1:
+            raise ValueError("block_size must be a positive integer")
+        if typecode is None:
+            typecode = "q" if all(isinstance(x, int) for x in arr) else "d"
+
+        self.n = len(arr)
+        self.block_size = block_size
+        if block_size is None:
+            self._keys, self._positions = self._build_eytzinger(arr, typecode), None
+        else:
+            self._keys, self._positions = self._build_blocks(arr, typecode, block_size)
+
+    def __len__(self):
+        return self.n
+
+    @staticmethod
+    def _build_eytzinger(arr, typecode):
+        # Slot k has children 2k and 2k + 1; slot 0 is unused.
+        # An in-order walk of the implicit tree visits the slots in sorted order.
+        n = len(arr)
+        keys = array(typecode, bytes(array(typecode).itemsize * (n + 1)))
+        i, k, stack = 0, 1, []
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            keys[k] = arr[i]
+            i += 1
+            k = 2 * k + 1
+        return keys
+
+    def _eytzinger_position(self, k):
+        # In-order rank of slot k, i.e. its position in the sorted array.
+        # In the perfect tree of height h, slot k at depth d has rank
+        # (2 * (k - 2^d) + 1) * 2^(h-1-d) - 1. The real tree only lacks bottom
+        # slots after n; bottom slots hold the even ranks of the perfect tree,
+        # so subtract the missing ones that come before k.
+        n = self.n
+        d = k.bit_length() - 1
+        h = n.bit_length()
+        rank = ((2 * (k - (1 << d)) + 1) << (h - 1 - d)) - 1
+        bottom = n - (1 << (h - 1)) + 1  # bottom slots present
+        return rank - max(0, (rank + 1) // 2 - bottom)
+
+    @staticmethod
+    def _build_blocks(arr, typecode, b):
+        # Node i holds slots [i*b, (i+1)*b) and has children i*(b+1) + 1 .. i*(b+1) + b + 1.
+        # The last node is padded with copies of the largest key that point past the end.
+        n = len(arr)
+        nodes = (n + b - 1) // b
+        pad = arr[-1] if n else 0
+        keys = array(typecode, [pad]) * (nodes * b)
+        positions = array("q", [n]) * (nodes * b)
+        i, stack = 0, [(0, 0)] if nodes else []
+        while stack:
+            node, j = stack.pop()
+            # In-order: child j, then key j, then child j + 1 ...
+            if j <= b:
+                stack.append((node, j + 1))
+                child = node * (b + 1) + j + 1
+                if j > 0 and i < n:
+                    slot = node * b + j - 1
+                    keys[slot] = arr[i]
+                    positions[slot] = i
+                    i += 1
+                if child < nodes:
+                    stack.append((child, 0))
+        return keys, positions
+
+    def _eytzinger_slot(self, target, strict):
+        # Descend to a leaf, then undo the trailing "went right" steps:
+        # the last left turn is the answer (-1 if there was none)
+        keys, n = self._keys, self.n
+        k = 1
+        if strict:
+            while k <= n:
+                k = 2 * k + (keys[k] <= target)
+        else:
+            while k <= n:
+                k = 2 * k + (keys[k] < target)
+        k >>= ((~k) & (k + 1)).bit_length()
+        return k if k else -1
+
+    def _block_slot(self, target, strict):
+        keys, b = self._keys, self.block_size
+        nodes = len(keys) // b
+        find = bisect_right if strict else bisect_left
+        best = -1
+        node = 0
+        while node < nodes:
+            start = node * b
+            slot = find(keys, target, start, start + b)
+            j = slot - start
+            if j < b:
+                # keys[slot] is the best candidate so far
+                best = slot
+            node = node * (b + 1) + j + 1
+        return best
+
+    def _slot(self, target, strict):
+        # Slot of the first key >= target (> target if strict); -1 if none
+        if self.block_size is None:
+            return self._eytzinger_slot(target, strict)
+        return self._block_slot(target, strict)
+
+    def _position(self, slot):
+        if self._positions is None:
+            return self._eytzinger_position(slot)
+        return self._positions[slot]
+
+    def lower_bound(self, target):
+        """
+        Returns:
+            int: Position of the first element >= target (len(arr) if none).
+        """
+        slot = self._slot(target, False)
+        return self._position(slot) if slot >= 0 else self.n
+
+    def upper_bound(self, target):
+        """
+        Returns:
+            int: Position of the first element > target (len(arr) if none).
+        """
+        slot = self._slot(target, True)
+        return self._position(slot) if slot >= 0 else self.n
+
+    def search(self, target):
+        """
+        Returns:
+            int: Position of the first occurrence of target; -1 if not found.
+        """
+        slot = self._slot(target, False)
+        if slot >= 0 and self._keys[slot] == target:
+            return self._position(slot)
+        return -1
+
+
+# Example usage and demonstration
+if __name__ == "__main__":
+    data = [10, 20, 20, 30, 40, 50, 60, 70, 80]
+    print("🌲 Eytzinger Index Examples")
+    print(f"Array: {data}\n")
+
+    for name, index in (("Eytzinger", EytzingerIndex(data)), ("Blocks of 4", EytzingerIndex(data, block_size=4))):
+        print(f"[{name}] search(60) → {index.search(60)}")
+        print(f"[{name}] search(65) → {index.search(65)}")
+        print(f"[{name}] lower_bound(20) → {index.lower_bound(20)}, upper_bound(20) → {index.upper_bound(20)}")
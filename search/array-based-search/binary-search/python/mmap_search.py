@@ -0,0 +1,143 @@
+import mmap
+import struct
+from bisect import bisect_left, bisect_right
+
+
+class MappedRecordFile:
+    """
+    Binary search over a file of fixed-width records sorted by key.
+
+    The file is memory-mapped and never loaded as a whole. Records are decoded
+    with ``struct.unpack_from`` straight from a ``memoryview`` of the mapping,
+    so a lookup copies nothing but the keys it actually compares.
+
+    With ``sparse_every=k`` every k-th key is kept in RAM. A query first
+    bisects that small index and then searches only one run of k records.
+    When k records fit in a page, that costs about one page fault per query.
+    """
+
+    def __init__(self, path, record_format, key_field=0, sparse_every=None):
+        """
+        Opens and maps the file.
+
+        Args:
+            path (str): Path to the sorted record file.
+            record_format (str): ``struct`` format of one record, e.g. '<qd'.
+            key_field (int): Index of the sort key inside the unpacked record.
+            sparse_every (int): Keep every k-th key in RAM (default: no index).
+        """
+        if sparse_every is not None and sparse_every < 1:
+            raise ValueError("sparse_every must be a positive integer")
+        self.record = struct.Struct(record_format)
+        self.key_field = key_field
+
+        self._file = open(path, "rb")
+        size = self._file.seek(0, 2)
+        if size % self.record.size:
+            self._file.close()
+            raise ValueError("file size is not a multiple of the record size")
+        self.n = size // self.record.size
+
+        # mmap cannot map an empty file
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self._view = memoryview(self._map) if size else memoryview(b"")
+
+        self.sparse_every = sparse_every
+        self._sparse = [self.key(i) for i in range(0, self.n, sparse_every)] if sparse_every else None
+
+    def __len__(self):
+        return self.n
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Releases the memoryview, the mapping and the file."""
+        self._view.release()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __getitem__(self, i):
+        """Returns the i-th record as a tuple."""
+        if not 0 <= i < self.n:
+            raise IndexError("record index out of range")
+        return self.record.unpack_from(self._view, i * self.record.size)
+
+    def key(self, i):
+        """Returns the key of the i-th record."""
+        return self.record.unpack_from(self._view, i * self.record.size)[self.key_field]
+
+    def _window(self, target, strict):
+        # Range of records that must contain the answer, narrowed by the sparse index
+        if self._sparse is None:
+            return 0, self.n
+        k = self.sparse_every
+        find = bisect_right if strict else bisect_left
+        block = find(self._sparse, target)
+        # The answer lies after sparse key block - 1 and at or before sparse key block
+        low = max(block - 1, 0) * k
+        high = min(block * k, self.n)
+        return low, high
+
+    def _bound(self, target, strict):
+        low, high = self._window(target, strict)
+        unpack, size, field, view = self.record.unpack_from, self.record.size, self.key_field, self._view
+        while low < high:
+            mid = (low + high) // 2
+            key = unpack(view, mid * size)[field]
+            if key < target or (strict and key == target):
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def lower_bound(self, target):
+        """
+        Returns:
+            int: Index of the first record with key >= target (len if none).
+        """
+        return self._bound(target, False)
+
+    def upper_bound(self, target):
+        """
+        Returns:
+            int: Index of the first record with key > target (len if none).
+        """
+        return self._bound(target, True)
+
+    def search(self, target):
+        """
+        Performs binary search for a key in the file.
+
+        Returns:
+            int: Index of the first record with that key if found; -1 otherwise.
+        """
+        i = self._bound(target, False)
+        if i < self.n and self.key(i) == target:
+            return i
+        return -1
+
+
+# Example usage and demonstration
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    record = struct.Struct("<qd")  # (key, value) pairs
+    path = os.path.join(tempfile.mkdtemp(), "records.bin")
+    with open(path, "wb") as f:
+        for key in range(0, 1000, 10):
+            f.write(record.pack(key, key / 10))
+
+    print("🗂️ Memory-Mapped Binary Search Example")
+    with MappedRecordFile(path, "<qd", sparse_every=16) as records:
+        print(f"Records: {len(records)}")
+        i = records.search(420)
+        print(f"✅ Found key 420 at record {i} → {records[i]}")
+        print(f"❌ Key 425 → {records.search(425)}")
+        print(f"lower_bound(425) → {records.lower_bound(425)}")
+    os.remove(path)
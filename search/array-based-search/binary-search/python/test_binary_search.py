@@ -1,5 +1,11 @@
+import random
 import unittest
-from binary_search import binary_search, binary_search_recursive
+from binary_search import binary_search, binary_search_recursive, binary_search_many
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TestBinarySearch(unittest.TestCase):
@@ -43,5 +49,33 @@ class TestBinarySearch(unittest.TestCase):
         self.assertIn(result_rec, range(5))
 
 
+class TestBinarySearchMany(unittest.TestCase):
+
+    def test_results_in_input_order(self):
+        arr = [10, 20, 30, 40, 50]
+        self.assertEqual(binary_search_many(arr, [50, 10, 35, 30, 60, 5]), [4, 0, -1, 2, -1, -1])
+
+    def test_empty_inputs(self):
+        self.assertEqual(binary_search_many([], [1, 2]), [-1, -1])
+        self.assertEqual(binary_search_many([1, 2], []), [])
+
+    def test_repeated_targets_and_duplicates(self):
+        arr = [1, 2, 2, 2, 3]
+        self.assertEqual(binary_search_many(arr, [2, 2, 3, 1]), [1, 1, 4, 0])
+
+    def test_matches_single_search(self):
+        rng = random.Random(7)
+        arr = sorted(rng.sample(range(10000), 500))
+        targets = [rng.randrange(10000) for _ in range(1000)]
+        expected = [binary_search(arr, t) for t in targets]
+        self.assertEqual(binary_search_many(arr, targets), expected)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_fast_path(self):
+        arr = np.array([10, 20, 30, 40, 50])
+        result = binary_search_many(arr, [50, 10, 35, 60])
+        self.assertEqual(result.tolist(), [4, 0, -1, -1])
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
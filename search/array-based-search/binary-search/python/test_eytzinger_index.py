@@ -0,0 +1,68 @@
+import bisect
+import random
+import unittest
+from eytzinger_index import EytzingerIndex
+
+
+class TestEytzingerIndex(unittest.TestCase):
+
+    LAYOUTS = (None, 1, 3, 16)
+
+    def check(self, arr):
+        for block_size in self.LAYOUTS:
+            index = EytzingerIndex(arr, block_size=block_size)
+            for target in range(-2, (arr[-1] if arr else 0) + 3):
+                with self.subTest(block_size=block_size, target=target):
+                    lower = bisect.bisect_left(arr, target)
+                    self.assertEqual(index.lower_bound(target), lower)
+                    self.assertEqual(index.upper_bound(target), bisect.bisect_right(arr, target))
+                    expected = lower if lower < len(arr) and arr[lower] == target else -1
+                    self.assertEqual(index.search(target), expected)
+
+    def test_empty_array(self):
+        for block_size in self.LAYOUTS:
+            index = EytzingerIndex([], block_size=block_size)
+            self.assertEqual(index.search(5), -1)
+            self.assertEqual(index.lower_bound(5), 0)
+
+    def test_single_element(self):
+        self.check([5])
+
+    def test_duplicates_report_first_position(self):
+        self.check([1, 2, 2, 2, 2, 3, 7, 7])
+
+    def test_random_arrays(self):
+        rng = random.Random(3)
+        for size in (2, 7, 8, 31, 64, 100):
+            self.check(sorted(rng.randrange(3 * size) for _ in range(size)))
+
+    def test_slot_to_position_formula(self):
+        # Compare the closed form with an in-order walk of the implicit tree,
+        # for every tree shape up to 300 keys (full, and every partial bottom level)
+        for n in range(1, 300):
+            index = EytzingerIndex(list(range(n)))
+            self.assertIsNone(index._positions)
+            order, stack, k = [], [], 1
+            while stack or k <= n:
+                while k <= n:
+                    stack.append(k)
+                    k *= 2
+                k = stack.pop()
+                order.append(k)
+                k = 2 * k + 1
+            self.assertEqual([index._eytzinger_position(k) for k in order], list(range(n)))
+
+    def test_float_keys(self):
+        arr = [0.5, 1.5, 2.25, 9.75]
+        index = EytzingerIndex(arr)
+        self.assertEqual(index.search(2.25), 2)
+        self.assertEqual(index.lower_bound(2.0), 2)
+        self.assertEqual(index.upper_bound(10.0), 4)
+
+    def test_invalid_block_size(self):
+        with self.assertRaises(ValueError):
+            EytzingerIndex([1, 2, 3], block_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
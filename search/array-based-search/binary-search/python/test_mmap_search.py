@@ -0,0 +1,94 @@
+import bisect
+import os
+import random
+import struct
+import tempfile
+import unittest
+from mmap_search import MappedRecordFile
+
+
+class TestMappedRecordFile(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, keys, record_format="<qd"):
+        record = struct.Struct(record_format)
+        path = os.path.join(self.dir.name, "records.bin")
+        with open(path, "wb") as f:
+            for key in keys:
+                f.write(record.pack(key, key * 0.5))
+        return path
+
+    def test_without_sparse_index(self):
+        path = self.write([1, 3, 3, 5, 8, 13, 21])
+        with MappedRecordFile(path, "<qd") as records:
+            self.assertEqual(len(records), 7)
+            self.assertEqual([records.search(t) for t in (0, 1, 3, 4, 21, 22)], [-1, 0, 1, -1, 6, -1])
+            self.assertEqual((records.lower_bound(3), records.upper_bound(3)), (1, 3))
+            self.assertEqual((records.lower_bound(22), records.upper_bound(-5)), (7, 0))
+
+    def test_sparse_window_holds_the_answer(self):
+        # Every target, including each sampled key and its neighbours, must fall in
+        # a window of at most k records that contains the bisect answer
+        rng = random.Random(11)
+        keys = sorted(rng.randrange(300) for _ in range(200))
+        path = self.write(keys)
+        for k in (1, 2, 7, 64, 500):
+            with MappedRecordFile(path, "<qd", sparse_every=k) as records:
+                for target in range(-2, 303):
+                    for strict, find in ((False, bisect.bisect_left), (True, bisect.bisect_right)):
+                        with self.subTest(k=k, target=target, strict=strict):
+                            low, high = records._window(target, strict)
+                            self.assertLessEqual(high - low, k)
+                            self.assertTrue(low <= find(keys, target) <= high)
+                            self.assertEqual(records._bound(target, strict), find(keys, target))
+
+    def test_duplicates_across_window_boundaries(self):
+        # A run of equal keys crosses several sparse samples
+        keys = [1, 2] + [5] * 11 + [9, 9, 10]
+        path = self.write(keys)
+        for k in (2, 4, 5):
+            with MappedRecordFile(path, "<qd", sparse_every=k) as records:
+                self.assertEqual(records.search(5), 2)
+                self.assertEqual(records.upper_bound(5), 13)
+                self.assertEqual((records.search(9), records.upper_bound(9)), (13, 15))
+                self.assertEqual((records.lower_bound(11), records.search(0)), (16, -1))
+
+    def test_empty_file(self):
+        path = self.write([])
+        for k in (None, 4):
+            with MappedRecordFile(path, "<qd", sparse_every=k) as records:
+                self.assertEqual(len(records), 0)
+                self.assertEqual((records.search(1), records.lower_bound(1), records.upper_bound(1)), (-1, 0, 0))
+
+    def test_records_are_decoded(self):
+        path = self.write([10, 20, 30])
+        with MappedRecordFile(path, "<qd") as records:
+            self.assertEqual(records[1], (20, 10.0))
+            with self.assertRaises(IndexError):
+                records[3]
+
+    def test_key_field(self):
+        record = struct.Struct("<dq")
+        path = os.path.join(self.dir.name, "swapped.bin")
+        with open(path, "wb") as f:
+            for key in (2, 4, 6):
+                f.write(record.pack(0.0, key))
+        with MappedRecordFile(path, "<dq", key_field=1) as records:
+            self.assertEqual(records.search(4), 1)
+            self.assertEqual(records.search(5), -1)
+
+    def test_truncated_file_rejected(self):
+        path = os.path.join(self.dir.name, "bad.bin")
+        with open(path, "wb") as f:
+            f.write(b"\x00" * 10)
+        with self.assertRaises(ValueError):
+            MappedRecordFile(path, "<qd")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,245 @@
+import asyncio
+import struct
+
+
+class PagedSequence:
+    """
+    Read-only sequence whose items are fetched page by page, on demand.
+
+    ``fetch_page(page)`` returns the list of items on that page (``page_size``
+    items, fewer on the last page, an empty list past the end). Every page is
+    fetched at most once and then cached. The total length is never needed:
+    indexing past the end raises ``IndexError`` like a list does.
+    """
+
+    def __init__(self, fetch_page, page_size):
+        if page_size < 1:
+            raise ValueError("page_size must be a positive integer")
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.pages = {}  # page number -> list of items
+        self.page_reads = 0
+
+    def _page(self, number):
+        page = self.pages.get(number)
+        if page is None:
+            page = list(self.fetch_page(number))
+            self.pages[number] = page
+            self.page_reads += 1
+        return page
+
+    def __getitem__(self, i):
+        if i < 0:
+            raise IndexError("negative indices are not supported")
+        page = self._page(i // self.page_size)
+        offset = i % self.page_size
+        if offset >= len(page):
+            raise IndexError("index past the end of the data")
+        return page[offset]
+
+
+class AsyncPagedSequence:
+    """
+    Asynchronous version of ``PagedSequence``: ``fetch_page`` is a coroutine.
+
+    Pages are cached as tasks, so a page that is being fetched is shared by
+    every caller, and ``prefetch`` can start fetches in the background.
+    """
+
+    def __init__(self, fetch_page, page_size):
+        if page_size < 1:
+            raise ValueError("page_size must be a positive integer")
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.pages = {}  # page number -> asyncio.Task returning the items
+        self.page_reads = 0
+
+    def prefetch(self, i):
+        """Starts fetching the page holding index i, if it is not cached yet."""
+        if i < 0:
+            return None
+        number = i // self.page_size
+        task = self.pages.get(number)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(number))
+            self.pages[number] = task
+            self.page_reads += 1
+        return task
+
+    async def _fetch(self, number):
+        return list(await self.fetch_page(number))
+
+    async def get(self, i):
+        """Returns item i, or raises IndexError past the end."""
+        if i < 0:
+            raise IndexError("negative indices are not supported")
+        page = await self.prefetch(i)
+        offset = i % self.page_size
+        if offset >= len(page):
+            raise IndexError("index past the end of the data")
+        return page[offset]
+
+
+def _accessor(seq):
+    # A plain callable get(i) is used as is; anything else is indexed
+    if callable(seq) and not hasattr(seq, "__getitem__"):
+        return seq
+    return seq.__getitem__
+
+
+def _value(get, i):
+    # get(i), or None past the end (treated as larger than any target)
+    try:
+        return get(i)
+    except IndexError:
+        return None
+
+
+def exponential_search_unbounded(seq, target):
+    """
+    Performs exponential search on sorted data of unknown length.
+
+    Only ``seq[i]`` (or ``seq(i)`` for an accessor callback) is used, and an
+    ``IndexError`` marks the end of the data, so this works with
+    ``PagedSequence``, any sequence-like object, or a plain function. The
+    doubling phase and the binary search each touch O(log n) items, so a
+    paged source reads a logarithmic number of pages.
+
+    Args:
+        seq: Sorted sequence supporting ``seq[i]``, or a callback ``get(i)``.
+        target: The value to search for.
+
+    Returns:
+        int: Index of the first occurrence of target if found; -1 otherwise.
+    """
+    get = _accessor(seq)
+    first = _value(get, 0)
+    if first is None:
+        return -1
+    if first >= target:
+        return 0 if first == target else -1
+
+    # Step 1: double the bound until seq[bound] >= target or the data ends
+    bound = 1
+    while True:
+        value = _value(get, bound)
+        if value is None or value >= target:
+            break
+        bound *= 2
+
+    # Step 2: lower bound in (bound // 2, bound]; past-the-end counts as "too large"
+    left, right = bound // 2 + 1, bound
+    while left < right:
+        mid = (left + right) // 2
+        value = _value(get, mid)
+        if value is not None and value < target:
+            left = mid + 1
+        else:
+            right = mid
+
+    return left if _value(get, left) == target else -1
+
+
+async def _async_value(seq, i):
+    try:
+        return await seq.get(i)
+    except IndexError:
+        return None
+
+
+async def exponential_search_unbounded_async(seq, target, lookahead=2):
+    """
+    Asynchronous exponential search over an ``AsyncPagedSequence``.
+
+    While the page of the current probe is being fetched, the pages of the
+    next ``lookahead`` doubling steps are fetched too. During the binary
+    search both possible next probes are prefetched. Page latency overlaps
+    instead of adding up.
+
+    Args:
+        seq (AsyncPagedSequence): Sorted paged data.
+        target: The value to search for.
+        lookahead (int): Doubling steps to prefetch ahead.
+
+    Returns:
+        int: Index of the first occurrence of target if found; -1 otherwise.
+    """
+    first = await _async_value(seq, 0)
+    if first is None:
+        return -1
+    if first >= target:
+        return 0 if first == target else -1
+
+    bound = 1
+    while True:
+        for step in range(1, lookahead + 1):
+            seq.prefetch(bound << step)
+        value = await _async_value(seq, bound)
+        if value is None or value >= target:
+            break
+        bound *= 2
+
+    left, right = bound // 2 + 1, bound
+    while left < right:
+        mid = (left + right) // 2
+        # Whichever way this probe goes, the next one is already on its way
+        seq.prefetch((left + mid) // 2)
+        seq.prefetch((mid + 1 + right) // 2)
+        value = await _async_value(seq, mid)
+        if value is not None and value < target:
+            left = mid + 1
+        else:
+            right = mid
+
+    return left if await _async_value(seq, left) == target else -1
+
+
+def file_page_fetcher(path, record_format, page_size, key_field=0):
+    """
+    Local stand-in for a slow page store: reads one page of fixed-width records.
+
+    Args:
+        path (str): File of ``struct``-packed records sorted by key.
+        record_format (str): ``struct`` format of one record.
+        page_size (int): Records per page.
+        key_field (int): Index of the key inside a record.
+
+    Returns:
+        callable: ``fetch_page(page)`` returning the keys on that page.
+    """
+    record = struct.Struct(record_format)
+
+    def fetch_page(page):
+        with open(path, "rb") as f:
+            f.seek(page * page_size * record.size)
+            data = f.read(page_size * record.size)
+        usable = len(data) - len(data) % record.size
+        return [fields[key_field] for fields in record.iter_unpack(data[:usable])]
+
+    return fetch_page
+
+
+# Example usage and demonstration
+if __name__ == "__main__":
+    print("🔍 Unbounded Exponential Search Example")
+
+    data = list(range(0, 3_000_000, 3))
+
+    def fetch_page(page):
+        # Pretend every page comes from a slow store
+        return data[page * 1024:(page + 1) * 1024]
+
+    pages = PagedSequence(fetch_page, page_size=1024)
+    result = exponential_search_unbounded(pages, 2_400_000)
+    print(f"✅ Found 2400000 at index {result} after reading {pages.page_reads} of {len(data) // 1024 + 1} pages.")
+
+    async def main():
+        async def fetch_page_async(page):
+            await asyncio.sleep(0.01)  # Simulated network latency
+            return fetch_page(page)
+
+        async_pages = AsyncPagedSequence(fetch_page_async, page_size=1024)
+        index = await exponential_search_unbounded_async(async_pages, 2_400_000)
+        print(f"✅ [async] Found 2400000 at index {index} ({async_pages.page_reads} page fetches started).")
+
+    asyncio.run(main())
@@ -0,0 +1,109 @@
+import asyncio
+import os
+import struct
+import tempfile
+import unittest
+from paged_exponential_search import (
+    AsyncPagedSequence,
+    PagedSequence,
+    exponential_search_unbounded,
+    exponential_search_unbounded_async,
+    file_page_fetcher,
+)
+
+
+def list_pages(data, page_size):
+    def fetch_page(page):
+        return data[page * page_size:(page + 1) * page_size]
+    return fetch_page
+
+
+class TestPagedExponentialSearch(unittest.TestCase):
+
+    def test_matches_list_index(self):
+        data = [1, 3, 3, 3, 7, 9, 12, 15, 20, 21, 30]
+        for page_size in (1, 2, 3, 4, 16):
+            for target in range(-1, 33):
+                pages = PagedSequence(list_pages(data, page_size), page_size)
+                expected = data.index(target) if target in data else -1
+                self.assertEqual(exponential_search_unbounded(pages, target), expected)
+
+    def test_empty_data(self):
+        pages = PagedSequence(list_pages([], 8), 8)
+        self.assertEqual(exponential_search_unbounded(pages, 5), -1)
+
+    def test_plain_list_and_callback(self):
+        data = list(range(0, 100, 2))
+        self.assertEqual(exponential_search_unbounded(data, 42), 21)
+        self.assertEqual(exponential_search_unbounded(data.__getitem__, 42), 21)
+        self.assertEqual(exponential_search_unbounded(lambda i: data[i], 43), -1)
+
+    def test_page_reads_are_logarithmic(self):
+        data = list(range(1_000_000))
+        pages = PagedSequence(list_pages(data, 256), 256)
+        self.assertEqual(exponential_search_unbounded(pages, 876_543), 876_543)
+        # Doubling and binary search each touch about log2(n / page_size) pages
+        self.assertLessEqual(pages.page_reads, 2 * (len(data) // 256).bit_length() + 2)
+
+    def test_pages_are_cached(self):
+        calls = []
+        data = list(range(1000))
+
+        def fetch_page(page):
+            calls.append(page)
+            return data[page * 10:(page + 1) * 10]
+
+        pages = PagedSequence(fetch_page, 10)
+        exponential_search_unbounded(pages, 500)
+        exponential_search_unbounded(pages, 501)
+        self.assertEqual(len(calls), len(set(calls)))
+
+    def test_file_page_fetcher(self):
+        record = struct.Struct("<qd")
+        fd, path = tempfile.mkstemp()
+        with os.fdopen(fd, "wb") as f:
+            for key in range(0, 5000, 5):
+                f.write(record.pack(key, key / 5))
+        try:
+            pages = PagedSequence(file_page_fetcher(path, "<qd", 64), 64)
+            self.assertEqual(exponential_search_unbounded(pages, 4995), 999)
+            self.assertEqual(exponential_search_unbounded(pages, 4996), -1)
+            self.assertEqual(exponential_search_unbounded(pages, 5000), -1)
+        finally:
+            os.remove(path)
+
+    def test_async_matches_sync(self):
+        data = [2, 4, 4, 8, 16, 16, 16, 32, 64, 100, 101]
+
+        async def run():
+            results = []
+            for target in range(0, 110):
+                async def fetch_page(page):
+                    await asyncio.sleep(0)
+                    return data[page * 3:(page + 1) * 3]
+                pages = AsyncPagedSequence(fetch_page, 3)
+                results.append(await exponential_search_unbounded_async(pages, target))
+            return results
+
+        expected = [data.index(t) if t in data else -1 for t in range(0, 110)]
+        self.assertEqual(asyncio.run(run()), expected)
+
+    def test_async_fetches_overlap(self):
+        data = list(range(100_000))
+        active = [0, 0]  # current, peak
+
+        async def fetch_page(page):
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+            await asyncio.sleep(0.001)
+            active[0] -= 1
+            return data[page * 100:(page + 1) * 100]
+
+        pages = AsyncPagedSequence(fetch_page, 100)
+        result = asyncio.run(exponential_search_unbounded_async(pages, 77_777))
+        self.assertEqual(result, 77_777)
+        self.assertGreater(active[1], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+from fibonacci_search import fibonacci_search
+from fibonacci_searcher import FibonacciSearcher
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "binary-search", "python"))
+from binary_search import binary_search  # noqa: E402
+
+
+def time_queries(search, targets):
+    # Average time per query, in microseconds
+    start = time.perf_counter()
+    for target in targets:
+        search(target)
+    return (time.perf_counter() - start) / len(targets) * 1e6
+
+
+def run(n, queries, k, seed, use_numpy):
+    rng = random.Random(seed)
+    arr = list(range(0, 2 * n, 2))
+    targets = [rng.randrange(2 * n) for _ in range(queries)]
+    searcher = FibonacciSearcher(arr, k=k)
+
+    methods = [
+        ("binary_search", lambda t: binary_search(arr, t)),
+        ("fibonacci_search", lambda t: fibonacci_search(arr, t)),
+        ("FibonacciSearcher.search", searcher.search),
+        (f"search_kary (k={k}, list)", searcher.search_kary),
+    ]
+    if use_numpy:
+        import numpy
+        # The same keys as a NumPy array: each k-ary step is one vectorized comparison
+        methods.append((f"search_kary (k={k}, NumPy array)", FibonacciSearcher(numpy.arange(0, 2 * n, 2), k=k).search_kary))
+    for name, search in methods:
+        print(f"{name:<45}{time_queries(search, targets):>10.2f}us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark FibonacciSearcher against binary_search.")
+    parser.add_argument("--exp", type=int, default=7, help="array size is 10^exp (default: 7)")
+    parser.add_argument("--queries", type=int, default=100000, help="random lookups (default: 100000)")
+    parser.add_argument("--k", type=int, default=16, help="pivots per step of search_kary (default: 16)")
+    parser.add_argument("--seed", type=int, default=42, help="random seed (default: 42)")
+    parser.add_argument("--numpy", action="store_true", help="also time search_kary on a NumPy array")
+    args = parser.parse_args()
+
+    print(f"⏱️ Fibonacci Searcher Benchmark on 10^{args.exp} elements (time per query)\n")
+    run(10 ** args.exp, args.queries, args.k, args.seed, args.numpy)
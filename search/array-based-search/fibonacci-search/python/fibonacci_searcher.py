@@ -0,0 +1,144 @@
+import sys
+from bisect import bisect_left
+
+
+class FibonacciSearcher:
+    """
+    Fibonacci search over one sorted array, built once and queried many times.
+
+    ``fibonacci_search`` regenerates the Fibonacci numbers on every call.
+    This searcher computes them once, up to the smallest one >= len(arr).
+    Each step then moves down the table by one or two places, so a query
+    does no setup work at all.
+
+    ``search_kary`` is a k-ary variant: every step compares the target
+    against k pivots at once, cutting the range into k + 1 parts. When arr is
+    a NumPy array, the k comparisons are a single vectorized operation.
+    """
+
+    def __init__(self, arr, k=16):
+        """
+        Builds the searcher.
+
+        Args:
+            arr (list | numpy.ndarray): Sorted elements (kept by reference).
+            k (int): Pivots per step for ``search_kary``.
+        """
+        if k < 1:
+            raise ValueError("k must be a positive integer")
+        self.arr = arr
+        self.n = len(arr)
+        self.k = k
+
+        # F(0), F(1), ... up to the smallest Fibonacci number >= n
+        fibs = [0, 1, 1]
+        while fibs[-1] < self.n:
+            fibs.append(fibs[-1] + fibs[-2])
+        self.fibs = fibs
+
+        self._steps = None  # NumPy array 1..k, made on the first k-ary query
+
+    def __len__(self):
+        return self.n
+
+    def search(self, target):
+        """
+        Performs Fibonacci search with the precomputed table.
+
+        Args:
+            target: The value to search for.
+
+        Returns:
+            int: Index of the target if found; -1 otherwise.
+        """
+        arr, fibs, n = self.arr, self.fibs, self.n
+        if n == 0:
+            return -1
+
+        # fibs[m] plays the role of F(k); fibs[m - 1] and fibs[m - 2] are F(k-1) and F(k-2)
+        m = len(fibs) - 1
+        offset = -1
+        while fibs[m] > 1:
+            i = min(offset + fibs[m - 2], n - 1)
+            value = arr[i]
+            if value < target:
+                # Cut off the front part
+                m -= 1
+                offset = i
+            elif value > target:
+                # Cut off the rear part
+                m -= 2
+            else:
+                return i
+
+        # Final check for last element
+        if fibs[m - 1] == 1 and offset + 1 < n and arr[offset + 1] == target:
+            return offset + 1
+        return -1
+
+    def search_many(self, targets):
+        """
+        Returns:
+            list: ``search(target)`` for each target, in input order.
+        """
+        search = self.search
+        return [search(target) for target in targets]
+
+    def _kary_window(self, target):
+        # Narrow [low, high] (possible lower-bound positions) with k pivots per step
+        k, low, high = self.k, 0, self.n
+        if type(self.arr).__module__ == "numpy":
+            np = sys.modules["numpy"]
+            if self._steps is None:
+                self._steps = np.arange(1, k + 1, dtype=np.int64)
+            values, steps = self.arr, self._steps
+            while high - low > k:
+                pivots = low + steps * (high - low) // (k + 1)
+                below = int(np.count_nonzero(values[pivots] < target))
+                if below:
+                    low = int(pivots[below - 1]) + 1
+                if below < k:
+                    high = int(pivots[below])
+        else:
+            arr = self.arr
+            while high - low > k:
+                span = high - low
+                pivots = [low + j * span // (k + 1) for j in range(1, k + 1)]
+                below = sum(arr[p] < target for p in pivots)
+                if below:
+                    low = pivots[below - 1] + 1
+                if below < k:
+                    high = pivots[below]
+        return low, high
+
+    def search_kary(self, target):
+        """
+        Performs k-ary search: log_(k+1) n steps of k comparisons each.
+
+        Args:
+            target: The value to search for.
+
+        Returns:
+            int: Index of the first occurrence of target if found; -1 otherwise.
+        """
+        low, high = self._kary_window(target)
+        i = bisect_left(self.arr, target, low, high)
+        if i < self.n and self.arr[i] == target:
+            return i
+        return -1
+
+
+# Example usage and demonstration
+if __name__ == "__main__":
+    print("🔍 Fibonacci Searcher Example")
+
+    data = list(range(0, 2000, 5))
+    searcher = FibonacciSearcher(data, k=8)
+    print(f"Array: 0, 5, ..., 1995 ({len(data)} elements), Fibonacci table size: {len(searcher.fibs)}")
+
+    for target in (0, 1230, 1995, 1231):
+        result = searcher.search(target)
+        if result != -1:
+            print(f"✅ Found {target} at index {result} (k-ary: {searcher.search_kary(target)}).")
+        else:
+            print(f"❌ {target} not found in the array.")
@@ -0,0 +1,61 @@
+import random
+import unittest
+from fibonacci_search import fibonacci_search
+from fibonacci_searcher import FibonacciSearcher
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestFibonacciSearcher(unittest.TestCase):
+
+    def test_matches_fibonacci_search(self):
+        rng = random.Random(3)
+        for n in list(range(0, 30)) + [100, 1000]:
+            data = sorted(rng.sample(range(3 * n + 1), n))
+            searcher = FibonacciSearcher(data)
+            for target in range(-1, 3 * n + 2):
+                self.assertEqual(searcher.search(target), fibonacci_search(data, target))
+
+    def test_search_many(self):
+        searcher = FibonacciSearcher([10, 20, 30, 40, 50, 60, 70, 80])
+        self.assertEqual(searcher.search_many([60, 10, 80, 65]), [5, 0, 7, -1])
+
+    def test_table_is_built_once(self):
+        searcher = FibonacciSearcher(list(range(1000)))
+        table = searcher.fibs
+        self.assertGreaterEqual(table[-1], 1000)
+        self.assertLess(table[-2], 1000)
+        for target in (1, 500, 999):
+            searcher.search(target)
+        self.assertIs(searcher.fibs, table)
+
+    def test_kary_returns_first_occurrence(self):
+        rng = random.Random(5)
+        data = sorted(rng.randrange(300) for _ in range(1000))
+        for k in (1, 2, 7, 16):
+            searcher = FibonacciSearcher(data, k=k)
+            for target in range(-1, 302):
+                expected = data.index(target) if target in data else -1
+                self.assertEqual(searcher.search_kary(target), expected)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_kary_on_numpy_array(self):
+        data = numpy.arange(0, 10000, 2)
+        searcher = FibonacciSearcher(data, k=4)
+        self.assertEqual(searcher.search_kary(1234), 617)
+        self.assertEqual(searcher.search_kary(1235), -1)
+        self.assertEqual(searcher.search_kary(10000), -1)
+        self.assertEqual(searcher.search_kary(0), 0)
+
+    def test_empty_and_invalid(self):
+        self.assertEqual(FibonacciSearcher([]).search(1), -1)
+        self.assertEqual(FibonacciSearcher([]).search_kary(1), -1)
+        with self.assertRaises(ValueError):
+            FibonacciSearcher([1, 2, 3], k=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
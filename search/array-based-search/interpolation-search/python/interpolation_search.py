@@ -1,31 +1,65 @@
-def interpolation_search(arr, target):
+class SearchStats:
+    """
+    Collects per-query probe counts from the search functions in this directory.
+
+    Pass the same object as ``stats=`` to any number of searches; every call
+    appends the number of array elements it probed.
+    """
+
+    def __init__(self):
+        self.counts = []
+
+    def record(self, probes):
+        self.counts.append(probes)
+
+    @property
+    def queries(self):
+        return len(self.counts)
+
+    @property
+    def total(self):
+        return sum(self.counts)
+
+    @property
+    def max(self):
+        return max(self.counts, default=0)
+
+    @property
+    def mean(self):
+        return self.total / len(self.counts) if self.counts else 0.0
+
+    @property
+    def last(self):
+        return self.counts[-1] if self.counts else 0
+
+
+def interpolation_search(arr, target, stats=None):
     """
     Performs interpolation search on a sorted array.
 
     Args:
         arr (list): Sorted list of elements (preferably uniformly distributed).
         target: The value to search for.
+        stats (SearchStats): Optional; receives the number of probes.
 
     Returns:
         int: Index of the target if found; -1 otherwise.
     """
     low = 0
     high = len(arr) - 1
-
-    # Handle empty array
-    if low > high:
-        return -1
+    probes = 0
+    result = -1
 
     while low <= high and arr[low] <= target <= arr[high]:
+        probes += 1
         # Avoid division by zero when all values in the range are equal
         if arr[high] == arr[low]:
             if arr[low] == target:
-                return low  # All elements are same; check if it's the target
-            else:
-                return -1  # Not present
+                result = low  # All elements are same; check if it's the target
+            break
 
         # Estimate position using interpolation formula
-        pos = low + ((target - arr[low]) * (high - low)) // (arr[high] - arr[low])
+        pos = low + int((target - arr[low]) * (high - low) // (arr[high] - arr[low]))
 
         # Ensure pos is within bounds
         if pos < low or pos > high:
@@ -33,13 +67,86 @@ def interpolation_search(arr, target):
 
         # Check if the estimated position holds the target
         if arr[pos] == target:
-            return pos
+            result = pos
+            break
         elif arr[pos] < target:
             low = pos + 1  # Target is in the right subarray
         else:
             high = pos - 1  # Target is in the left subarray
 
-    return -1  # Not found
+    if stats is not None:
+        stats.record(probes)
+    return result
+
+
+def interpolation_search_adaptive(arr, target, stats=None):
+    """
+    Performs interpolation-binary search (IBS) on a sorted array.
+
+    Every step makes one interpolation probe and then one bisection probe
+    on the side where the target must be. The bisection probe at least
+    halves the range, so the worst case is O(log n) probes even on skewed
+    data. On uniform data the interpolation probe lands close to the
+    target and the search stays O(log log n).
+
+    Args:
+        arr (list): Sorted list of numbers.
+        target: The value to search for.
+        stats (SearchStats): Optional; receives the number of probes.
+
+    Returns:
+        int: Index of the first occurrence of target if found; -1 otherwise.
+    """
+    low, high = 0, len(arr) - 1
+    probes = 0
+    result = -1
+
+    while low <= high:
+        # Target outside the remaining value range: not present
+        if target < arr[low] or target > arr[high]:
+            break
+        if arr[low] == arr[high]:
+            result = low if arr[low] == target else -1
+            break
+
+        # Interpolation probe
+        pos = low + int((target - arr[low]) * (high - low) / (arr[high] - arr[low]))
+        pos = min(max(pos, low), high)
+        probes += 1
+        if arr[pos] < target:
+            low = pos + 1
+            # Bisection probe between the interpolation point and the right end
+            mid = (low + high) // 2
+            if low <= mid:
+                probes += 1
+                if arr[mid] < target:
+                    low = mid + 1
+                else:
+                    high = mid
+        else:
+            # arr[pos] >= target: the first occurrence is at or before pos
+            if arr[pos] == target and (pos == low or arr[pos - 1] < target):
+                probes += pos > low
+                result = pos
+                break
+            high = pos
+            # Bisection probe between the left end and the interpolation point
+            mid = (low + high) // 2
+            if mid < high:
+                probes += 1
+                if arr[mid] < target:
+                    low = mid + 1
+                else:
+                    high = mid
+            elif arr[low] == target:
+                result = low
+                break
+            else:
+                break
+
+    if stats is not None:
+        stats.record(probes)
+    return result
 
 
 # Example usage and demonstration
@@ -59,4 +166,14 @@ if __name__ == "__main__":
     if result != -1:
         print(f"✅ Found {target_value} at index {result}.")
     else:
-        print(f"❌ {target_value} not found in the array.")
\ No newline at end of file
+        print(f"❌ {target_value} not found in the array.")
+
+    # Skewed data: plain interpolation needs many probes, the adaptive version does not
+    skewed = [i ** 4 for i in range(1000)]
+    plain, adaptive = SearchStats(), SearchStats()
+    for value in skewed[::50]:
+        interpolation_search(skewed, value, stats=plain)
+        interpolation_search_adaptive(skewed, value, stats=adaptive)
+    print(f"\n📊 Skewed data, {plain.queries} queries:")
+    print(f"   interpolation_search:          max {plain.max} probes, mean {plain.mean:.1f}")
+    print(f"   interpolation_search_adaptive: max {adaptive.max} probes, mean {adaptive.mean:.1f}")
\ No newline at end of file
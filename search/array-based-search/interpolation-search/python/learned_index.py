@@ -0,0 +1,193 @@
+import math
+from bisect import bisect_left, bisect_right
+
+
+class LearnedIndex:
+    """
+    Learned index over a sorted array: a piecewise-linear model of the key CDF.
+
+    ``interpolation_search`` fits one straight line through the whole array,
+    so it degrades badly on skewed regions. ``binary_search`` ignores the key
+    distribution completely. This index splits the keys into segments, fitting
+    each one with a line so that every key's predicted position is within
+    ``epsilon`` of its true position. A lookup picks the segment, predicts a
+    position, and finishes with a binary search inside the recorded error
+    window. If the answer falls outside that window, it widens the window
+    with exponential search.
+    """
+
+    def __init__(self, arr, epsilon=32):
+        """
+        Builds the model.
+
+        Args:
+            arr (list): Sorted list of numbers.
+            epsilon (int): Target maximum prediction error, in positions.
+        """
+        if epsilon < 0:
+            raise ValueError("epsilon must be non-negative")
+        self.epsilon = epsilon
+        self.keys = list(arr)
+        # One entry per segment: first key, first position, slope, measured max error
+        self._first_keys = []
+        self._first_positions = []
+        self._slopes = []
+        self._errors = []
+        self._fit(0)
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def model_size(self):
+        """Number of linear segments in the model."""
+        return len(self._first_keys)
+
+    @property
+    def max_error(self):
+        """Largest prediction error of any key, in positions."""
+        return max(self._errors, default=0)
+
+    def _fit(self, segment):
+        # Refit every segment from `segment` on (greedy shrinking cone).
+        # Only the first occurrence of each key matters, since lookups return it.
+        start = self._first_positions[segment] if segment < len(self._first_positions) else 0
+        del self._first_keys[segment:], self._first_positions[segment:]
+        del self._slopes[segment:], self._errors[segment:]
+        keys, eps, n = self.keys, self.epsilon, len(self.keys)
+
+        i = start
+        while i < n:
+            key0, pos0 = keys[i], i
+            low, high = 0.0, math.inf
+            i += 1
+            while i < n:
+                key = keys[i]
+                if key == keys[i - 1]:
+                    i += 1
+                    continue
+                dk = key - key0
+                new_low = max(low, (i - eps - pos0) / dk)
+                new_high = min(high, (i + eps - pos0) / dk)
+                if new_low > new_high:
+                    break
+                low, high = new_low, new_high
+                i += 1
+            slope = low if high == math.inf else (low + high) / 2
+            self._first_keys.append(key0)
+            self._first_positions.append(pos0)
+            self._slopes.append(slope)
+            self._errors.append(0)
+            # Record the error actually achieved, so lookups never rely on rounding
+            s = len(self._first_keys) - 1
+            error = 0
+            for j in range(pos0, i):
+                if j == pos0 or keys[j] != keys[j - 1]:
+                    error = max(error, abs(self._predict(s, keys[j]) - j))
+            self._errors[s] = error
+
+    def _segment_end(self, s):
+        # One past the last position covered by segment s
+        if s + 1 < len(self._first_positions):
+            return self._first_positions[s + 1]
+        return len(self.keys)
+
+    def _predict(self, s, key):
+        # Predicted position of key inside segment s, as an int
+        return self._first_positions[s] + int(self._slopes[s] * (key - self._first_keys[s]))
+
+    def lower_bound(self, target, stats=None):
+        """
+        Args:
+            target: The value to search for.
+            stats (SearchStats): Optional; receives the number of probes
+                (window checks plus the binary search steps).
+
+        Returns:
+            int: Index of the first element >= target (len(arr) if none).
+        """
+        keys, n = self.keys, len(self.keys)
+        s = bisect_right(self._first_keys, target) - 1
+        if s < 0:
+            if stats is not None:
+                stats.record(0)
+            return 0
+
+        # Predict, clamp to the segment, and search the error window
+        start, end = self._first_positions[s], self._segment_end(s)
+        guess = min(max(self._predict(s, target), start), end)
+        error = self._errors[s]
+        low, high = max(guess - error, 0), min(guess + error + 1, n)
+
+        # Widen exponentially if the answer is not inside the window
+        probes = 0
+        step = error + 1
+        while low > 0 and keys[low - 1] >= target:
+            probes += 1
+            low = max(low - step, 0)
+            step *= 2
+        probes += low > 0
+        step = error + 1
+        while high < n and keys[high - 1] < target:
+            probes += 1
+            high = min(high + step, n)
+            step *= 2
+        probes += high < n
+
+        if stats is not None:
+            stats.record(probes + (high - low).bit_length())
+        return bisect_left(keys, target, low, high)
+
+    def search(self, target, stats=None):
+        """
+        Performs a learned-index lookup.
+
+        Args:
+            target: The value to search for.
+            stats (SearchStats): Optional; receives the number of probes.
+
+        Returns:
+            int: Index of the first occurrence of target if found; -1 otherwise.
+        """
+        i = self.lower_bound(target, stats)
+        if i < len(self.keys) and self.keys[i] == target:
+            return i
+        return -1
+
+    def extend(self, values):
+        """
+        Appends sorted values (all >= the current last key) and refits the tail.
+
+        Only the last segment is rebuilt, together with any new segments the
+        appended keys need.
+
+        Args:
+            values (iterable): New keys, in sorted order.
+        """
+        values = list(values)
+        if not values:
+            return
+        if (self.keys and values[0] < self.keys[-1]) or any(a > b for a, b in zip(values, values[1:])):
+            raise ValueError("appended values must keep the array sorted")
+        self.keys.extend(values)
+        self._fit(max(len(self._first_keys) - 1, 0))
+
+
+# Example usage and demonstration
+if __name__ == "__main__":
+    print("📈 Learned Index Example")
+
+    # Skewed data: dense at the start, sparse at the end
+    data = [i * i for i in range(10000)]
+    index = LearnedIndex(data, epsilon=16)
+    print(f"Keys: {len(index)}, segments: {index.model_size}, max error: {index.max_error}")
+
+    for target in (49, 2500, 99980001, 50):
+        result = index.search(target)
+        if result != -1:
+            print(f"✅ Found {target} at index {result}.")
+        else:
+            print(f"❌ {target} not found in the array.")
+
+    index.extend([10 ** 8 + i for i in range(1000)])
+    print(f"After appending 1000 keys: segments: {index.model_size}, max error: {index.max_error}")
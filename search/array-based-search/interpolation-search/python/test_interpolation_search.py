@@ -1,5 +1,7 @@
+import math
+import random
 import unittest
-from interpolation_search import interpolation_search
+from interpolation_search import interpolation_search, interpolation_search_adaptive, SearchStats
 
 
 class TestInterpolationSearch(unittest.TestCase):
@@ -47,5 +49,51 @@ class TestInterpolationSearch(unittest.TestCase):
         self.assertEqual(interpolation_search([5, 5, 5, 5], 3), -1)
 
 
+class TestInterpolationSearchAdaptive(unittest.TestCase):
+
+    def test_basic_cases(self):
+        self.assertEqual(interpolation_search_adaptive([10, 20, 30, 40, 50], 40), 3)
+        self.assertEqual(interpolation_search_adaptive([10, 20, 30, 40, 50], 35), -1)
+        self.assertEqual(interpolation_search_adaptive([10, 20, 30], 5), -1)
+        self.assertEqual(interpolation_search_adaptive([10, 20, 30], 99), -1)
+        self.assertEqual(interpolation_search_adaptive([], 1), -1)
+        self.assertEqual(interpolation_search_adaptive([5], 5), 0)
+
+    def test_duplicates_return_first_occurrence(self):
+        self.assertEqual(interpolation_search_adaptive([1, 3, 3, 3, 3, 8], 3), 1)
+        self.assertEqual(interpolation_search_adaptive([5, 5, 5, 5], 5), 0)
+
+    def test_float_keys(self):
+        self.assertEqual(interpolation_search_adaptive([0.5, 1.25, 2.0, 7.5], 2.0), 2)
+
+    def test_skewed_data_stays_logarithmic(self):
+        arr = [i ** 4 for i in range(4096)]
+        plain, adaptive = SearchStats(), SearchStats()
+        for value in arr[::97]:
+            self.assertEqual(interpolation_search_adaptive(arr, value, stats=adaptive), arr.index(value))
+            interpolation_search(arr, value, stats=plain)
+        self.assertLessEqual(adaptive.max, 2 * math.ceil(math.log2(len(arr))) + 2)
+        self.assertGreater(plain.max, adaptive.max)
+
+    def test_uniform_data_needs_few_probes(self):
+        arr = list(range(0, 300000, 3))
+        stats = SearchStats()
+        for value in random.Random(1).sample(arr, 200):
+            interpolation_search_adaptive(arr, value, stats=stats)
+        self.assertLessEqual(stats.max, 4)
+
+
+class TestSearchStats(unittest.TestCase):
+
+    def test_counts_every_query(self):
+        stats = SearchStats()
+        interpolation_search([10, 20, 30, 40], 30, stats=stats)
+        interpolation_search([], 30, stats=stats)
+        self.assertEqual(stats.queries, 2)
+        self.assertEqual(stats.counts, [1, 0])
+        self.assertEqual(stats.last, 0)
+        self.assertEqual(stats.mean, 0.5)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,86 @@
+import bisect
+import random
+import unittest
+from interpolation_search import SearchStats
+from learned_index import LearnedIndex
+
+
+class TestLearnedIndex(unittest.TestCase):
+
+    def assertLowerBounds(self, index, arr, targets):
+        targets = list(targets)
+        self.assertEqual([index.lower_bound(t) for t in targets], [bisect.bisect_left(arr, t) for t in targets])
+
+    def test_uniform_keys_need_one_segment(self):
+        arr = list(range(0, 1000, 5))
+        index = LearnedIndex(arr, epsilon=0)
+        self.assertEqual(index.model_size, 1)
+        self.assertEqual(index.max_error, 0)
+        self.assertLowerBounds(index, arr, range(-3, 1003))
+
+    def test_skewed_keys_respect_epsilon(self):
+        arr = [i ** 3 for i in range(2000)]
+        index = LearnedIndex(arr, epsilon=8)
+        self.assertGreater(index.model_size, 1)
+        self.assertLessEqual(index.max_error, 8 + 1)
+        self.assertLowerBounds(index, arr, arr[::7] + [x + 1 for x in arr[::13]])
+
+    def test_duplicates_return_first_occurrence(self):
+        arr = [1, 1, 1, 2, 2, 5, 5, 5, 5, 9]
+        index = LearnedIndex(arr, epsilon=1)
+        self.assertEqual([index.search(t) for t in range(0, 11)], [-1, 0, 3, -1, -1, 5, -1, -1, -1, 9, -1])
+
+    def test_window_widens_when_the_error_is_understated(self):
+        # Zero out the recorded errors: every window is one slot wide, so most
+        # answers lie outside it and must be found by widening
+        arr = [i ** 3 for i in range(2000)]
+        index = LearnedIndex(arr, epsilon=8)
+        index._errors = [0] * len(index._errors)
+        targets = arr[::7] + [x + 1 for x in arr[::13]] + [-1, arr[-1] + 1]
+        stats = SearchStats()
+        for target in targets:
+            self.assertEqual(index.lower_bound(target, stats=stats), bisect.bisect_left(arr, target))
+        self.assertGreater(stats.max, 1)
+
+    def test_targets_between_segments_and_in_long_runs(self):
+        # Absent keys in the gap after a segment, and a run of duplicates longer
+        # than epsilon, both put the answer past the predicted window
+        arr = list(range(100)) + [10 ** 6] * 50 + list(range(2 * 10 ** 6, 2 * 10 ** 6 + 100))
+        index = LearnedIndex(arr, epsilon=2)
+        self.assertEqual(index.search(10 ** 6), 100)
+        self.assertEqual(index.lower_bound(10 ** 6 + 1), 150)
+        self.assertLowerBounds(index, arr, [99, 100, 500, 10 ** 6 - 1, 1999999, 2 * 10 ** 6 + 99, 3 * 10 ** 6])
+
+    def test_empty_array(self):
+        index = LearnedIndex([])
+        self.assertEqual(index.search(3), -1)
+        self.assertEqual(index.lower_bound(3), 0)
+        self.assertEqual(index.model_size, 0)
+
+    def test_extend_refits_tail(self):
+        rng = random.Random(5)
+        arr = sorted(rng.randrange(10000) for _ in range(500))
+        index = LearnedIndex(arr, epsilon=4)
+        added = sorted(rng.randrange(10000, 50000) for _ in range(300))
+        index.extend(added)
+        arr += added
+        self.assertEqual(len(index), len(arr))
+        self.assertLowerBounds(index, arr, [rng.randrange(-10, 50010) for _ in range(500)])
+
+    def test_probe_counts_are_reported(self):
+        arr = list(range(0, 10000, 2))
+        index = LearnedIndex(arr, epsilon=4)
+        stats = SearchStats()
+        for target in (0, 5000, 9998, 7):
+            index.search(target, stats=stats)
+        self.assertEqual(stats.queries, 4)
+        self.assertLessEqual(stats.max, 8)
+
+    def test_extend_rejects_unsorted(self):
+        index = LearnedIndex([1, 2, 3])
+        with self.assertRaises(ValueError):
+            index.extend([0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import argparse
+import random
+import sys
+import time
+
+from compressed_jump_search import CompressedIntList
+from jump_search import jump_search
+
+
+def time_queries(search, targets):
+    # Average time per query, in microseconds
+    start = time.perf_counter()
+    for target in targets:
+        search(target)
+    return (time.perf_counter() - start) / len(targets) * 1e6
+
+
+def list_bytes(values):
+    # The list's pointer array plus one int object per element
+    return sys.getsizeof(values) + sum(sys.getsizeof(x) for x in values)
+
+
+def accumulate_gaps(rng, n, max_gap):
+    # Sorted IDs with random gaps in [1, max_gap]
+    value = 10 ** 9
+    for _ in range(n):
+        value += rng.randint(1, max_gap)
+        yield value
+
+
+def run(exponents, queries, block_size, max_gap, seed):
+    rng = random.Random(seed)
+    header = f"{'n':>10}{'list B/elem':>14}{'compressed B/elem':>20}{'jump_search':>14}{'compressed':>13}"
+    print(header)
+    print("-" * len(header))
+    for n in (10 ** e for e in exponents):
+        values = list(accumulate_gaps(rng, n, max_gap))
+        compressed = CompressedIntList(values, block_size=block_size)
+        targets = [rng.randrange(values[-1] + 1) for _ in range(queries)]
+        row = f"{n:>10}"
+        row += f"{list_bytes(values) / n:>14.1f}"
+        row += f"{compressed.nbytes / n:>20.2f}"
+        row += f"{time_queries(lambda t: jump_search(values, t), targets):>12.1f}us"
+        row += f"{time_queries(compressed.search, targets):>11.1f}us"
+        print(row)
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark CompressedIntList against jump_search on a list.")
+    parser.add_argument("--min-exp", type=int, default=4, help="smallest list is 10^min-exp (default: 4)")
+    parser.add_argument("--max-exp", type=int, default=6, help="largest list is 10^max-exp (default: 6)")
+    parser.add_argument("--queries", type=int, default=2000, help="random lookups per size (default: 2000)")
+    parser.add_argument("--block-size", type=int, default=128, help="values per compressed block (default: 128)")
+    parser.add_argument("--max-gap", type=int, default=100, help="largest gap between IDs (default: 100)")
+    parser.add_argument("--seed", type=int, default=42, help="random seed (default: 42)")
+    args = parser.parse_args()
+
+    print("⏱️ Compressed Jump Search Benchmark (memory and time per query)\n")
+    run(range(args.min_exp, args.max_exp + 1), args.queries, args.block_size, args.max_gap, args.seed)
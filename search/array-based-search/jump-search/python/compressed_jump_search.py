@@ -0,0 +1,161 @@
+import math
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+
+# Narrowest unsigned typecode able to hold the largest delta of a block
+_DELTA_TYPECODES = sorted("BHILQ", key=lambda code: array(code).itemsize)
+
+
+def _delta_typecode(max_delta):
+    bits = max_delta.bit_length()
+    for code in _DELTA_TYPECODES:
+        if array(code).itemsize * 8 >= bits:
+            return code
+    raise OverflowError("delta does not fit in 64 bits")
+
+
+class CompressedIntList:
+    """
+    Sorted 64-bit integers stored as compressed, fixed-size blocks.
+
+    A Python list spends a pointer plus a whole int object on every element.
+    Here each block of ``block_size`` values keeps its first value as a frame
+    of reference, followed by the gaps between consecutive values, packed
+    into ``bytes`` with the narrowest width (1, 2, 4 or 8 bytes) that fits
+    the largest gap in the block. Posting lists and ID lists have small gaps,
+    so most blocks use one or two bytes per element.
+
+    A skip table keeps the largest value of every block. A lookup jump
+    searches the skip table, then decodes the one block that can hold the
+    target.
+    """
+
+    def __init__(self, values, block_size=128):
+        """
+        Compresses the values.
+
+        Args:
+            values (iterable): Sorted integers in the signed 64-bit range. The
+                iterable is consumed once and never copied as a whole.
+            block_size (int): Values per compressed block.
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be a positive integer")
+        self.block_size = block_size
+        self.n = 0
+        self._bases = array("q")    # first value of each block
+        self._maxima = array("q")   # last value of each block (the skip table)
+        self._offsets = array("Q", [0])  # byte offset of each block's gaps
+        self._widths = bytearray()  # index into _DELTA_TYPECODES per block
+        data = bytearray()
+
+        # Stream the input: only one block of values is held at a time
+        block = []
+        previous = None
+        for value in values:
+            if previous is not None and value < previous:
+                raise ValueError("values must be sorted")
+            previous = value
+            block.append(value)
+            if len(block) == block_size:
+                self._append_block(block, data)
+                block = []
+        if block:
+            self._append_block(block, data)
+        self._data = bytes(data)
+
+    def _append_block(self, block, data):
+        # Encodes one block: its first value, then the gaps in the narrowest width
+        gaps = [b - a for a, b in zip(block, block[1:])]
+        code = _delta_typecode(max(gaps, default=0))
+        data += array(code, gaps).tobytes()
+        self._bases.append(block[0])
+        self._maxima.append(block[-1])
+        self._offsets.append(len(data))
+        self._widths.append(_DELTA_TYPECODES.index(code))
+        self.n += len(block)
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def nbytes(self):
+        """Memory used by the compressed data and the tables, in bytes."""
+        tables = (self._bases, self._maxima, self._offsets)
+        return len(self._data) + len(self._widths) + sum(t.itemsize * len(t) for t in tables)
+
+    def _decode(self, block):
+        # All values of one block, as a list
+        gaps = array(_DELTA_TYPECODES[self._widths[block]])
+        gaps.frombytes(memoryview(self._data)[self._offsets[block]:self._offsets[block + 1]])
+        return list(accumulate(gaps, initial=self._bases[block]))
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("index out of range")
+        return self._decode(i // self.block_size)[i % self.block_size]
+
+    def __iter__(self):
+        for block in range(len(self._bases)):
+            yield from self._decode(block)
+
+    def __contains__(self, target):
+        return self.search(target) != -1
+
+    def search(self, target):
+        """
+        Performs two-level jump search: over the skip table, then inside one block.
+
+        Args:
+            target (int): The value to search for.
+
+        Returns:
+            int: Index of the first occurrence of target if found; -1 otherwise.
+        """
+        maxima = self._maxima
+        m = len(maxima)
+        if m == 0:
+            return -1
+
+        # Level 1: jump search over the block maxima
+        step = math.isqrt(m)
+        prev, end = 0, step
+        while end < m and maxima[end - 1] < target:
+            prev = end
+            end += step
+        for block in range(prev, min(end, m)):
+            if maxima[block] >= target:
+                break
+        else:
+            return -1
+
+        # Level 2: decode that single block and search it
+        values = self._decode(block)
+        i = bisect_left(values, target)
+        if values[i] == target:
+            return block * self.block_size + i
+        return -1
+
+
+# Example usage and demonstration
+if __name__ == "__main__":
+    import sys
+
+    # A posting list: document IDs with small gaps
+    ids = list(range(1_000_000, 3_000_000, 7))
+    postings = CompressedIntList(ids)
+
+    print("🗜️ Compressed Jump Search Example")
+    list_bytes = sys.getsizeof(ids) + sum(sys.getsizeof(x) for x in ids)
+    print(f"Elements: {len(postings)}")
+    print(f"List: {list_bytes / len(ids):.1f} bytes/element, compressed: {postings.nbytes / len(ids):.2f} bytes/element")
+
+    for target in (1_000_000, 2_000_006, 2_000_007):
+        result = postings.search(target)
+        if result != -1:
+            print(f"✅ Found {target} at index {result}.")
+        else:
+            print(f"❌ {target} not found in the list.")
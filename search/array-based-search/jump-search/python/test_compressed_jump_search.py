@@ -0,0 +1,63 @@
+import random
+import unittest
+from compressed_jump_search import CompressedIntList
+
+
+class TestCompressedJumpSearch(unittest.TestCase):
+
+    def test_round_trip(self):
+        values = [-5, -5, 0, 3, 300, 70000, 2 ** 40, 2 ** 62]
+        for block_size in (1, 2, 3, 128):
+            compressed = CompressedIntList(values, block_size=block_size)
+            self.assertEqual(list(compressed), values)
+            self.assertEqual([compressed[i] for i in range(len(values))], values)
+            self.assertEqual(compressed[-1], values[-1])
+
+    def test_search_matches_list_index(self):
+        rng = random.Random(7)
+        values = sorted(rng.randrange(5000) for _ in range(2000))
+        for block_size in (1, 5, 64):
+            compressed = CompressedIntList(values, block_size=block_size)
+            for target in range(-1, 5001, 3):
+                expected = values.index(target) if target in values else -1
+                self.assertEqual(compressed.search(target), expected)
+
+    def test_duplicates_across_blocks_return_first(self):
+        values = [1, 2, 2, 2, 2, 2, 2, 2, 3]
+        compressed = CompressedIntList(values, block_size=2)
+        self.assertEqual(compressed.search(2), 1)
+        self.assertIn(3, compressed)
+        self.assertNotIn(4, compressed)
+
+    def test_empty(self):
+        compressed = CompressedIntList([])
+        self.assertEqual(len(compressed), 0)
+        self.assertEqual(compressed.search(1), -1)
+        self.assertEqual(list(compressed), [])
+
+    def test_small_gaps_compress_to_one_byte(self):
+        compressed = CompressedIntList(range(0, 100000, 3))
+        self.assertLess(compressed.nbytes / len(compressed), 1.5)
+
+    def test_builds_from_a_generator(self):
+        compressed = CompressedIntList((3 * i for i in range(10000)), block_size=64)
+        self.assertEqual(len(compressed), 10000)
+        self.assertEqual(compressed.search(2997), 999)
+        self.assertEqual(compressed.search(2998), -1)
+        self.assertEqual(compressed[-1], 29997)
+
+    def test_rejects_unsorted_input(self):
+        with self.assertRaises(ValueError):
+            CompressedIntList([3, 1, 2])
+        with self.assertRaises(ValueError):
+            CompressedIntList(iter(list(range(500)) + [7]), block_size=16)
+        with self.assertRaises(ValueError):
+            CompressedIntList([1, 2], block_size=0)
+
+    def test_index_out_of_range(self):
+        with self.assertRaises(IndexError):
+            CompressedIntList([1, 2, 3])[3]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,312 @@
+import os
+import pickle
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import compress, count as _count
+from multiprocessing import shared_memory
+
+# Inputs with at least this many elements are scanned in chunks on a pool
+PARALLEL_THRESHOLD = 1 << 20
+
+# find() scans NumPy arrays in blocks of this size, so it can stop early
+_NUMPY_BLOCK = 1 << 16
+
+
+def _is_numpy(arr):
+    return type(arr).__module__ == "numpy"
+
+
+def _byte_value(target):
+    # Elements of bytes are ints; accept a one-byte bytes object as well
+    if isinstance(target, (bytes, bytearray)):
+        if len(target) != 1:
+            raise ValueError("bytes targets must be a single byte")
+        return target[0]
+    return target
+
+
+def _scan(arr, lo, hi, target, predicate, mode):
+    # Scans arr[lo:hi] with the fastest built-in available for its type.
+    # mode "all" returns the hit indices in order, mode "count" their number.
+    if _is_numpy(arr):
+        np = sys.modules["numpy"]
+        view = arr[lo:hi]
+        mask = predicate(view) if predicate else view == target
+        if mode == "count":
+            return int(np.count_nonzero(mask))
+        return np.flatnonzero(mask) + lo
+
+    if predicate is None and isinstance(arr, (bytes, bytearray)):
+        target = _byte_value(target)
+        if not (isinstance(target, int) and 0 <= target < 256):
+            return 0 if mode == "count" else []
+        if mode == "count":
+            return arr.count(target, lo, hi)
+        hits, i = [], arr.find(target, lo, hi)
+        while i != -1:
+            hits.append(i)
+            i = arr.find(target, i + 1, hi)
+        return hits
+
+    if predicate is None and isinstance(arr, (list, tuple, array)):
+        if mode == "count":
+            return arr.count(target) if lo == 0 and hi == len(arr) else arr[lo:hi].count(target)
+        hits, i = [], lo
+        try:
+            while True:
+                i = arr.index(target, i, hi)
+                hits.append(i)
+                i += 1
+        except ValueError:
+            return hits
+
+    # Predicate scans, and sequences without a built-in search
+    items = arr[lo:hi]
+    matches = map(predicate, items) if predicate else (x == target for x in items)
+    if mode == "count":
+        return sum(map(bool, matches))
+    return list(compress(range(lo, hi), matches))
+
+
+def _scan_offset(chunk, offset, target, predicate, mode):
+    # Scans a copied chunk in a worker process; hit indices are shifted by offset
+    result = _scan(chunk, 0, len(chunk), target, predicate, mode)
+    if mode == "count":
+        return result
+    return result + offset if _is_numpy(result) else [i + offset for i in result]
+
+
+def _scan_shared(name, kind, fmt, n, lo, hi, target, predicate, mode):
+    # Scans elements [lo, hi) of a buffer the parent process put in shared memory
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        if kind == "numpy":
+            import numpy
+            view = numpy.ndarray((n,), dtype=fmt, buffer=shm.buf)
+            result = _scan(view, lo, hi, target, predicate, mode)
+            del view
+            return result
+        if kind == "array":
+            chunk = array(fmt)
+            with shm.buf[lo * chunk.itemsize:hi * chunk.itemsize] as part:
+                chunk.frombytes(part)
+        else:
+            with shm.buf[lo:hi] as part:
+                chunk = bytes(part)
+        return _scan_offset(chunk, lo, target, predicate, mode)
+    finally:
+        shm.close()
+
+
+def _share(arr):
+    # Copies a buffer input into shared memory: (block, kind, format)
+    if _is_numpy(arr):
+        kind, fmt = "numpy", arr.dtype.str
+    elif isinstance(arr, array):
+        kind, fmt = "array", arr.typecode
+    else:
+        kind, fmt = "bytes", "B"
+    data = memoryview(arr).cast("B")
+    shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+    shm.buf[:len(data)] = data
+    data.release()
+    return shm, kind, fmt
+
+
+def _is_buffer(arr):
+    # Inputs that _share can put in shared memory
+    return _is_numpy(arr) or isinstance(arr, (array, bytes, bytearray))
+
+
+def _picklable(predicate):
+    try:
+        pickle.dumps(predicate)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+def _run(arr, target, predicate, mode, workers, executor):
+    # Serial scan for small inputs; chunks on a thread or process pool above the threshold
+    if _is_numpy(arr):
+        arr = arr.ravel()
+    n = len(arr)
+    workers = workers or os.cpu_count() or 1
+    if n < PARALLEL_THRESHOLD:
+        return _scan(arr, 0, n, target, predicate, mode)
+    if executor is None:
+        # NumPy releases the GIL while it compares, so threads scale for it.
+        # Other buffers go to processes through shared memory; lists and tuples
+        # would have to be pickled to the workers, which costs more than the scan.
+        if _is_numpy(arr):
+            executor = "thread"
+        elif _is_buffer(arr) and (predicate is None or _picklable(predicate)):
+            executor = "process"
+        else:
+            return _scan(arr, 0, n, target, predicate, mode)
+    own_pool = isinstance(executor, str)
+    if own_pool and workers == 1:
+        return _scan(arr, 0, n, target, predicate, mode)
+
+    if executor == "process" or isinstance(executor, ProcessPoolExecutor):
+        if not _is_buffer(arr):
+            raise ValueError("process pools need a buffer input (array.array, bytes, bytearray or NumPy array)")
+        if predicate is not None and not _picklable(predicate):
+            raise ValueError("process pools need a picklable predicate (a module-level function)")
+
+    if executor == "process":
+        pool = ProcessPoolExecutor(max_workers=workers)
+    elif executor == "thread":
+        pool = ThreadPoolExecutor(max_workers=workers)
+    elif own_pool:
+        raise ValueError('executor must be "process", "thread" or an Executor')
+    else:
+        pool = executor
+
+    chunks = 4 * workers
+    bounds = [n * c // chunks for c in range(chunks + 1)]
+    ranges = [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if lo < hi]
+    shared = None
+    try:
+        if isinstance(pool, ProcessPoolExecutor):
+            shared = _share(arr)
+            shm, kind, fmt = shared
+            futures = [pool.submit(_scan_shared, shm.name, kind, fmt, n, lo, hi, target, predicate, mode)
+                       for lo, hi in ranges]
+        else:
+            futures = [pool.submit(_scan, arr, lo, hi, target, predicate, mode) for lo, hi in ranges]
+        parts = [future.result() for future in futures]
+    finally:
+        if own_pool:
+            pool.shutdown()
+        if shared is not None:
+            shared[0].close()
+            shared[0].unlink()
+
+    if mode == "count":
+        return sum(parts)
+    if _is_numpy(arr):
+        return sys.modules["numpy"].concatenate(parts)
+    return [i for part in parts for i in part]
+
+
+def find(arr, target):
+    """
+    Returns the index of the first element equal to target.
+
+    Picks the scan by input type: ``list.index``/``tuple.index``/``array.index``,
+    ``bytes.find``, NumPy comparison in blocks (stopping at the first block with
+    a hit), or a plain loop for any other sequence.
+
+    Args:
+        arr: list, tuple, array.array, bytes/bytearray, NumPy array or sequence.
+        target: The value to search for (an int or one byte for bytes input).
+
+    Returns:
+        int: Index of the first occurrence (flat index for NumPy), otherwise -1.
+    """
+    if _is_numpy(arr):
+        np = sys.modules["numpy"]
+        flat = arr.ravel()
+        for lo in range(0, len(flat), _NUMPY_BLOCK):
+            hits = np.flatnonzero(flat[lo:lo + _NUMPY_BLOCK] == target)
+            if hits.size:
+                return lo + int(hits[0])
+        return -1
+    if isinstance(arr, (bytes, bytearray)):
+        target = _byte_value(target)
+        return arr.find(target) if isinstance(target, int) and 0 <= target < 256 else -1
+    if isinstance(arr, (list, tuple, array)):
+        try:
+            return arr.index(target)
+        except ValueError:
+            return -1
+    return find_if(arr, lambda x: x == target)
+
+
+def find_if(arr, predicate):
+    """
+    Returns the index of the first element for which predicate(element) is true.
+
+    For NumPy input, predicate receives a block of the array and must return a
+    boolean mask, e.g. ``lambda a: a > 10``.
+
+    Returns:
+        int: Index of the first match, otherwise -1.
+    """
+    if _is_numpy(arr):
+        np = sys.modules["numpy"]
+        flat = arr.ravel()
+        for lo in range(0, len(flat), _NUMPY_BLOCK):
+            hits = np.flatnonzero(predicate(flat[lo:lo + _NUMPY_BLOCK]))
+            if hits.size:
+                return lo + int(hits[0])
+        return -1
+    return next(compress(_count(), map(predicate, arr)), -1)
+
+
+def find_all(arr, target, workers=None, executor=None):
+    """
+    Returns the indices of all elements equal to target, in order.
+
+    Inputs of at least ``PARALLEL_THRESHOLD`` elements are split into chunks
+    and scanned on a pool. Threads share the input directly. Process workers
+    read buffer inputs (NumPy, array.array, bytes) from one shared-memory
+    copy; lists and tuples are scanned serially unless threads are requested.
+
+    Args:
+        arr: list, tuple, array.array, bytes/bytearray, NumPy array or sequence.
+        target: The value to search for.
+        workers (int): Pool size (default: os.cpu_count(); 1 scans serially).
+        executor (str | Executor): "thread", "process", or an existing
+            ``concurrent.futures`` executor (default: threads for NumPy input,
+            processes for other buffers, a serial scan otherwise). Processes
+            need a buffer input and, for predicate scans, a picklable predicate.
+
+    Returns:
+        list | numpy.ndarray: Hit indices (a NumPy array for NumPy input).
+    """
+    return _run(arr, target, None, "all", workers, executor)
+
+
+def find_all_if(arr, predicate, workers=None, executor=None):
+    """
+    Returns the indices of all elements for which predicate(element) is true.
+
+    Takes the same arguments as ``find_all``. With NumPy input, predicate maps
+    an array to a boolean mask. With a process pool, predicate must be
+    picklable (a module-level function).
+    """
+    return _run(arr, None, predicate, "all", workers, executor)
+
+
+def count(arr, target, workers=None, executor=None):
+    """
+    Returns the number of elements equal to target (``list.count``, ``bytes.count``,
+    ``numpy.count_nonzero``), with the same chunked parallel scan as ``find_all``.
+    """
+    return _run(arr, target, None, "count", workers, executor)
+
+
+def count_if(arr, predicate, workers=None, executor=None):
+    """
+    Returns the number of elements for which predicate(element) is true.
+    """
+    return _run(arr, None, predicate, "count", workers, executor)
+
+
+# Example usage and demonstration
+if __name__ == "__main__":
+    data = [10, 50, 30, 70, 80, 20, 90, 40, 20]
+    print("🔎 Linear Scan Examples")
+    print(f"Array: {data}\n")
+    print(f"find(20) → {find(data, 20)}")
+    print(f"find_all(20) → {find_all(data, 20)}")
+    print(f"count(20) → {count(data, 20)}")
+    print(f"find_if(x > 60) → {find_if(data, lambda x: x > 60)}")
+    print(f"find_all_if(x > 60) → {find_all_if(data, lambda x: x > 60)}")
+
+    text = b"linear search over bytes"
+    print(f"\nBytes: {text!r}")
+    print(f"find_all(b'e') → {find_all(text, b'e')}")
@@ -15,6 +15,56 @@ def linear_search(arr, target):
     return -1  # Return -1 if target is not found
 
 
+def linear_search_stream(iterable, targets, find_all=False):
+    """
+    Scans an iterable once for many targets, yielding hits as they are found.
+
+    The iterable is consumed lazily and never materialized. Without find_all,
+    each target is reported once (its first position), and the scan stops
+    pulling items as soon as every target has been seen.
+
+    Args:
+        iterable: Any iterable of hashable elements (list, generator, file, ...).
+        targets (iterable): The values to search for.
+        find_all (bool): Report every position instead of only the first.
+
+    Yields:
+        tuple: (element, index) for each hit, in scan order.
+    """
+    remaining = set(targets)  # Hash set: one O(1) membership test per element
+    if not remaining:
+        return
+    for i, x in enumerate(iterable):
+        if x in remaining:
+            yield x, i
+            if not find_all:
+                remaining.discard(x)
+                if not remaining:
+                    return  # Every target found: stop early
+
+
+def linear_search_multi(arr, targets, find_all=False):
+    """
+    Performs linear search for many targets in a single pass, O(n + m).
+
+    Args:
+        arr (list): The list to search in.
+        targets (iterable): The values to search for.
+        find_all (bool): Return every position instead of only the first.
+
+    Returns:
+        dict: For each target, its first index (-1 if not found), or the list
+        of all its indices when find_all is true.
+    """
+    result = {target: [] if find_all else -1 for target in targets}
+    for target, i in linear_search_stream(arr, result, find_all):
+        if find_all:
+            result[target].append(i)
+        else:
+            result[target] = i
+    return result
+
+
 # Example usage and demonstration
 if __name__ == "__main__":
     # Sample data
@@ -28,4 +78,7 @@ if __name__ == "__main__":
     if result != -1:
         print(f"✅ Found {target_value} at index {result}.")
     else:
-        print(f"❌ {target_value} not found in the array.")
\ No newline at end of file
+        print(f"❌ {target_value} not found in the array.")
+
+    # Several targets in one pass
+    print(f"Positions of 30, 90 and 60: {linear_search_multi(data, [30, 90, 60])}")
\ No newline at end of file
@@ -0,0 +1,110 @@
+import random
+import unittest
+from array import array
+import linear_scan
+from linear_scan import count, count_if, find, find_all, find_all_if, find_if
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def is_three(x):
+    return x == 3
+
+
+class TestLinearScan(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(11)
+        self.data = [rng.randrange(5) for _ in range(500)]
+        self.hits = [i for i, x in enumerate(self.data) if x == 3]
+
+    def inputs(self):
+        return [self.data, tuple(self.data), array("b", self.data), bytes(self.data), bytearray(self.data)]
+
+    def test_find(self):
+        for arr in self.inputs():
+            self.assertEqual(find(arr, 3), self.data.index(3))
+            self.assertEqual(find(arr, 7), -1)
+        self.assertEqual(find(range(10, 20), 15), 5)
+        self.assertEqual(find([], 1), -1)
+
+    def test_bytes_targets(self):
+        text = b"abracadabra"
+        self.assertEqual(find(text, b"c"), 4)
+        self.assertEqual(find_all(text, ord("a")), [0, 3, 5, 7, 10])
+        self.assertEqual(count(text, b"b"), 2)
+        self.assertEqual(find(text, 300), -1)
+        with self.assertRaises(ValueError):
+            find_all(text, b"ab")
+
+    def test_find_all_and_count(self):
+        for arr in self.inputs():
+            self.assertEqual(find_all(arr, 3), self.hits)
+            self.assertEqual(count(arr, 3), len(self.hits))
+
+    def test_predicate_scans(self):
+        expected = [i for i, x in enumerate(self.data) if x > 2]
+        self.assertEqual(find_if(self.data, lambda x: x > 2), expected[0])
+        self.assertEqual(find_if(self.data, lambda x: x > 9), -1)
+        self.assertEqual(find_all_if(self.data, lambda x: x > 2), expected)
+        self.assertEqual(count_if(self.data, lambda x: x > 2), len(expected))
+
+    def test_chunked_scan_keeps_hits_in_order(self):
+        saved = linear_scan.PARALLEL_THRESHOLD
+        linear_scan.PARALLEL_THRESHOLD = 16
+        try:
+            for executor in (None, "thread", "process"):
+                for arr in self.inputs()[2:] if executor == "process" else self.inputs():
+                    self.assertEqual(find_all(arr, 3, workers=3, executor=executor), self.hits)
+                    self.assertEqual(count(arr, 3, workers=3, executor=executor), len(self.hits))
+                buffer = array("b", self.data)
+                self.assertEqual(find_all_if(buffer, is_three, workers=2, executor=executor), self.hits)
+                self.assertEqual(count_if(buffer, is_three, workers=2, executor=executor), len(self.hits))
+        finally:
+            linear_scan.PARALLEL_THRESHOLD = saved
+
+    def test_default_pool_accepts_closures(self):
+        saved = linear_scan.PARALLEL_THRESHOLD
+        linear_scan.PARALLEL_THRESHOLD = 16
+        try:
+            wanted = 3
+            for arr in (self.data, array("b", self.data)):
+                self.assertEqual(find_all_if(arr, lambda x: x == wanted, workers=2), self.hits)
+                self.assertEqual(count_if(arr, lambda x: x == wanted, workers=2), len(self.hits))
+        finally:
+            linear_scan.PARALLEL_THRESHOLD = saved
+
+    def test_invalid_executor(self):
+        saved = linear_scan.PARALLEL_THRESHOLD
+        linear_scan.PARALLEL_THRESHOLD = 16
+        try:
+            with self.assertRaises(ValueError):
+                find_all(self.data, 3, workers=2, executor="fiber")
+            with self.assertRaises(ValueError):
+                find_all(self.data, 3, workers=2, executor="process")
+            with self.assertRaises(ValueError):
+                find_all_if(array("b", self.data), lambda x: x == 3, workers=2, executor="process")
+        finally:
+            linear_scan.PARALLEL_THRESHOLD = saved
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        values = numpy.array(self.data).reshape(20, 25)
+        self.assertEqual(find(values, 3), self.hits[0])
+        self.assertEqual(find_all(values, 3).tolist(), self.hits)
+        self.assertEqual(count(values, 3), len(self.hits))
+        self.assertEqual(find_all_if(values, lambda a: a == 3).tolist(), self.hits)
+        saved = linear_scan.PARALLEL_THRESHOLD
+        linear_scan.PARALLEL_THRESHOLD = 16
+        try:
+            for executor in ("thread", "process"):
+                self.assertEqual(find_all(values, 3, workers=3, executor=executor).tolist(), self.hits)
+        finally:
+            linear_scan.PARALLEL_THRESHOLD = saved
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from linear_search import linear_search
+from linear_search import linear_search, linear_search_multi, linear_search_stream
 
 
 class TestLinearSearch(unittest.TestCase):
@@ -29,6 +29,38 @@ class TestLinearSearch(unittest.TestCase):
         # Linear search returns the first occurrence
         self.assertEqual(linear_search([5, 5, 5], 5), 0)
 
+    def test_multi_first_positions(self):
+        arr = [10, 50, 30, 70, 50, 20, 30]
+        self.assertEqual(linear_search_multi(arr, [30, 50, 99]), {30: 2, 50: 1, 99: -1})
+
+    def test_multi_all_positions(self):
+        arr = [10, 50, 30, 70, 50, 20, 30]
+        self.assertEqual(linear_search_multi(arr, [30, 50, 99], find_all=True), {30: [2, 6], 50: [1, 4], 99: []})
+
+    def test_multi_matches_single_searches(self):
+        arr = [7, 3, 9, 3, 1, 8, 7]
+        targets = list(range(11))
+        self.assertEqual(linear_search_multi(arr, targets), {t: linear_search(arr, t) for t in targets})
+
+    def test_multi_empty_inputs(self):
+        self.assertEqual(linear_search_multi([], [1, 2]), {1: -1, 2: -1})
+        self.assertEqual(linear_search_multi([1, 2], []), {})
+
+    def test_stream_stops_once_all_targets_found(self):
+        consumed = []
+
+        def numbers():
+            for x in range(1000):
+                consumed.append(x)
+                yield x
+        hits = list(linear_search_stream(numbers(), [3, 5]))
+        self.assertEqual(hits, [(3, 3), (5, 5)])
+        self.assertEqual(len(consumed), 6)
+
+    def test_stream_find_all(self):
+        hits = list(linear_search_stream(iter("abracadabra"), "ab", find_all=True))
+        self.assertEqual(hits, [("a", 0), ("b", 1), ("a", 3), ("a", 5), ("a", 7), ("b", 8), ("a", 10)])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
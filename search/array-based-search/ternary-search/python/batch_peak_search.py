@@ -0,0 +1,108 @@
+import sys
+from array import array
+
+
+def _peak(row, width):
+    # Binary search on the slope of one row: the peak is the first i with row[i] >= row[i + 1]
+    low, high = 0, width - 1
+    while low < high:
+        mid = (low + high) // 2
+        if row[mid] < row[mid + 1]:
+            low = mid + 1
+        else:
+            high = mid
+    return low if width else -1
+
+
+def _peaks_numpy(np, values):
+    # The same descent for every row at once: low and high are arrays of indices
+    n, width = values.shape
+    if width == 0:
+        return np.full(n, -1, dtype=np.intp)
+    rows = np.arange(n)
+    low = np.zeros(n, dtype=np.intp)
+    high = np.full(n, width - 1, dtype=np.intp)
+    for _ in range((width - 1).bit_length()):
+        mid = (low + high) >> 1
+        rising = values[rows, mid] < values[rows, np.minimum(mid + 1, width - 1)]
+        rising &= low < high
+        low = np.where(rising, mid + 1, low)
+        high = np.where(rising, high, mid)
+    return low
+
+
+def ternary_search_peak_many(rows, width=None):
+    """
+    Finds the peak index of every row of a batch of unimodal arrays.
+
+    Each row increases, then decreases, like the input of ``ternary_search_peak``.
+    Instead of ternary search, every row is searched by binary search on the
+    slope: about log2(width) probes instead of 2 * log1.5(width). With NumPy
+    installed, all rows take each step together with vectorized index
+    arithmetic, so the Python loop runs log2(width) times in total, not once
+    per row.
+
+    Buffer inputs (``array.array``, ``memoryview``, ``bytes``) are read in place
+    without copying: pass the row length as ``width`` when the buffer is flat.
+
+    Args:
+        rows: 2D NumPy array, list of sequences, or a buffer of row-major data.
+        width (int): Row length, required for flat buffers.
+
+    Returns:
+        numpy.ndarray | array: Peak index of each row (-1 for empty rows),
+        as an intp NumPy array when NumPy is installed, otherwise array('q').
+    """
+    if type(rows).__module__ == "numpy":
+        if rows.ndim != 2:
+            raise ValueError("rows must form a two-dimensional array")
+        return _peaks_numpy(sys.modules["numpy"], rows)
+
+    # Lists and buffers are vectorized too when NumPy can be imported
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if not isinstance(rows, (list, tuple)):
+        # Buffer input: a flat, zero-copy view of the row-major data
+        view = memoryview(rows)
+        if width is None:
+            if view.ndim != 2:
+                raise ValueError("width is required for flat buffers")
+            width = view.shape[1]
+        if view.ndim > 1:
+            view = view.cast("B").cast(view.format)
+        if width < 1 or len(view) % width:
+            raise ValueError("buffer length is not a multiple of width")
+        if np:
+            # np.frombuffer shares the buffer's memory
+            return _peaks_numpy(np, np.frombuffer(view, dtype=view.format).reshape(-1, width))
+        return array("q", (_peak(view[start:start + width], width) for start in range(0, len(view), width)))
+
+    if np:
+        if rows and len({len(row) for row in rows}) == 1:
+            values = np.asarray(rows)
+        else:
+            # No rows, or rows of different lengths: search them one by one
+            return np.array([_peak(row, len(row)) for row in rows], dtype=np.intp)
+        if values.ndim != 2:
+            raise ValueError("rows must form a two-dimensional array")
+        return _peaks_numpy(np, values)
+    return array("q", (_peak(row, len(row)) for row in rows))
+
+
+# Example usage and demonstration
+if __name__ == "__main__":
+    print("⛰️ Batched Peak Search Example")
+
+    profiles = [
+        [1, 3, 5, 7, 8, 6, 4, 2],
+        [10, 8, 6, 4, 3, 2, 1, 0],
+        [0, 1, 2, 3, 4, 5, 6, 9],
+    ]
+    print(f"Peaks of {len(profiles)} rows: {list(ternary_search_peak_many(profiles))}")
+
+    # Zero-copy: 3 rows of 5 doubles, stored flat
+    flat = array("d", [1, 4, 9, 4, 1, 2, 1, 0, -1, -2, 0, 1, 2, 3, 2.5])
+    print(f"Peaks of a flat array('d') with width 5: {list(ternary_search_peak_many(flat, width=5))}")
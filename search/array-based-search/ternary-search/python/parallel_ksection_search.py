@@ -0,0 +1,158 @@
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+_EPS = sys.float_info.epsilon
+
+
+def _k_section(left, right, precision, k, max_evaluations):
+    # Generator driving the search: yields the points to evaluate next and
+    # receives their values; returns (best x, number of evaluations).
+    # Each round cuts [left, right] at k equally spaced points and keeps the two
+    # gaps around the best one, so the bracket shrinks by 2 / (k + 1) per round.
+    # It cannot shrink below a few float spacings, whatever precision asks for.
+    best_x = best_value = None
+    evaluations = 0
+    while right - left > precision + 4 * _EPS * max(abs(left), abs(right)):
+        step = (right - left) / (k + 1)
+        points = [left + i * step for i in range(1, k + 1)]
+        if best_x is not None and k % 2:
+            # The best point is the middle of the new bracket: reuse its value
+            points[k // 2] = best_x
+        todo = [x for x in points if x != best_x]
+        if max_evaluations is not None and evaluations + len(todo) > max_evaluations:
+            break
+
+        values = iter((yield todo))
+        evaluations += len(todo)
+        values = [best_value if x == best_x else next(values) for x in points]
+
+        j = max(range(k), key=values.__getitem__)
+        bracket = (left, right)
+        left = points[j - 1] if j > 0 else left
+        right = points[j + 1] if j + 1 < k else right
+        best_x, best_value = points[j], values[j]
+        if (left, right) == bracket:
+            break  # Rounding left no room for progress
+
+    if best_x is None:
+        best_x = (left + right) / 2
+    return best_x, evaluations
+
+
+def _check_arguments(k, max_evaluations):
+    if k < 2:
+        raise ValueError("k must be at least 2")
+    if max_evaluations is not None and max_evaluations < k:
+        raise ValueError("max_evaluations must be at least k")
+
+
+def k_section_search_max(f, left, right, precision=1e-9, k=None, executor="process", workers=None,
+                         max_evaluations=None):
+    """
+    Finds the x-value that maximizes a unimodal function f(x) within [left, right],
+    evaluating k points of the bracket in parallel per round.
+
+    ``ternary_search_function_max`` shrinks the bracket to 2/3 per round. Here
+    every round evaluates k interior points at once and keeps only the
+    neighbourhood of the best one, so the bracket shrinks to 2 / (k + 1). With
+    enough workers, a round takes as long as one call to f, and the number of
+    rounds drops by about log((k + 1) / 2) / log(1.5).
+
+    Args:
+        f (callable): Unimodal function to maximize. With the process pool it
+            must be picklable (a module-level function).
+        left (float): Left bound of search interval.
+        right (float): Right bound of search interval.
+        precision (float): Desired precision (tolerance); the search also stops
+            once the bracket is only a few float spacings wide.
+        k (int): Points evaluated per round (default: the number of workers, at least 2).
+        executor (str | Executor): "process" (default), "thread", or an existing
+            ``concurrent.futures`` executor, which is left running.
+        workers (int): Pool size (default: os.cpu_count()).
+        max_evaluations (int): Optional budget of calls to f; a round that
+            would exceed it is not started.
+
+    Returns:
+        tuple: (approximate x-value where f(x) is maximum, number of calls to f).
+    """
+    workers = workers or os.cpu_count() or 1
+    k = k or max(workers, 2)
+    _check_arguments(k, max_evaluations)
+
+    if executor == "process":
+        pool = ProcessPoolExecutor(max_workers=workers)
+    elif executor == "thread":
+        pool = ThreadPoolExecutor(max_workers=workers)
+    elif isinstance(executor, str):
+        raise ValueError('executor must be "process", "thread" or an Executor')
+    else:
+        pool = executor
+
+    rounds = _k_section(left, right, precision, k, max_evaluations)
+    try:
+        todo = next(rounds)
+        while True:
+            todo = rounds.send(list(pool.map(f, todo)))
+    except StopIteration as done:
+        return done.value
+    finally:
+        if pool is not executor:
+            pool.shutdown()
+
+
+async def k_section_search_max_async(f, left, right, precision=1e-9, k=4, max_evaluations=None):
+    """
+    Asynchronous version of ``k_section_search_max`` for coroutine objectives.
+
+    The k calls of a round run concurrently with ``asyncio.gather``. This suits
+    objectives that wait on something else, such as a remote job or a
+    subprocess.
+
+    Args:
+        f (coroutine function): Unimodal function to maximize, ``await f(x)``.
+        left (float): Left bound of search interval.
+        right (float): Right bound of search interval.
+        precision (float): Desired precision (tolerance).
+        k (int): Points evaluated per round.
+        max_evaluations (int): Optional budget of calls to f.
+
+    Returns:
+        tuple: (approximate x-value where f(x) is maximum, number of calls to f).
+    """
+    _check_arguments(k, max_evaluations)
+    rounds = _k_section(left, right, precision, k, max_evaluations)
+    try:
+        todo = next(rounds)
+        while True:
+            todo = rounds.send(await asyncio.gather(*(f(x) for x in todo)))
+    except StopIteration as done:
+        return done.value
+
+
+def _slow_parabola(x):
+    # Stand-in for an expensive simulation: 10 ms per call, waiting outside the GIL
+    time.sleep(0.01)
+    return -x * x + 6 * x + 5  # Max at x=3
+
+
+# Example usage and demonstration
+if __name__ == "__main__":
+    print("⚡ Parallel k-Section Search Example")
+    print("Function: f(x) = -x² + 6x + 5, 10 ms per call")
+
+    for k in (2, 8):
+        start = time.perf_counter()
+        x, calls = k_section_search_max(_slow_parabola, 0, 6, precision=1e-6, k=k, executor="thread", workers=k)
+        elapsed = time.perf_counter() - start
+        print(f"✅ k={k}: x ≈ {x:.6f} after {calls} evaluations in {elapsed:.2f}s")
+
+    async def slow_parabola_async(x):
+        await asyncio.sleep(0.01)
+        return -x * x + 6 * x + 5
+
+    start = time.perf_counter()
+    x, calls = asyncio.run(k_section_search_max_async(slow_parabola_async, 0, 6, precision=1e-6, k=8))
+    print(f"✅ [async] k=8: x ≈ {x:.6f} after {calls} evaluations in {time.perf_counter() - start:.2f}s")
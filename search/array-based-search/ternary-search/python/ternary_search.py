@@ -1,3 +1,7 @@
+import math
+import sys
+
+
 def ternary_search_peak(arr):
     """
     Finds the index of the maximum element in a unimodal (mountain) array using iterative ternary search.
@@ -63,6 +67,165 @@ def ternary_search_function_max(f, left, right, precision=1e-9):
     return (left + right) / 2
 
 
+# Golden ratio constants: 1/phi and 1 - 1/phi
+_INV_PHI = (math.sqrt(5) - 1) / 2
+_INV_PHI2 = 1 - _INV_PHI
+_EPS = sys.float_info.epsilon
+_SQRT_EPS = math.sqrt(_EPS)
+
+
+class _MemoizedFunction:
+    # Calls f at most once per point; counts the calls that actually ran f
+
+    def __init__(self, f, cache=None):
+        self.f = f
+        self.cache = {} if cache is None else cache
+        self.evaluations = 0
+
+    def __call__(self, x):
+        if x in self.cache:
+            return self.cache[x]
+        self.evaluations += 1
+        value = self.cache[x] = self.f(x)
+        return value
+
+
+def _check_budget(max_evaluations):
+    if max_evaluations is not None and max_evaluations < 2:
+        raise ValueError("max_evaluations must be at least 2")
+
+
+def golden_section_search_max(f, left, right, precision=1e-9, max_evaluations=None, cache=None):
+    """
+    Finds the x-value that maximizes a unimodal function f(x) within [left, right].
+
+    Same search as ``ternary_search_function_max``, but the two interior points
+    split the interval in the golden ratio. One of them is then still
+    interior after each step, so every step calls f only once instead of
+    twice. Evaluated points are memoized.
+
+    Args:
+        f (callable): Unimodal function to maximize.
+        left (float): Left bound of search interval.
+        right (float): Right bound of search interval.
+        precision (float): Desired precision (tolerance); the search also stops
+            once the bracket is only a few float spacings wide.
+        max_evaluations (int): Optional budget of calls to f.
+        cache (dict): Optional x -> f(x) memo, shared between searches.
+
+    Returns:
+        tuple: (approximate x-value where f(x) is maximum, number of calls to f).
+    """
+    _check_budget(max_evaluations)
+    g = _MemoizedFunction(f, cache)
+
+    c = right - _INV_PHI * (right - left)
+    d = left + _INV_PHI * (right - left)
+    fc, fd = g(c), g(d)
+
+    # The bracket cannot shrink below a few float spacings, whatever precision asks for
+    while (right - left > precision + 4 * _EPS * max(abs(left), abs(right))
+           and (max_evaluations is None or g.evaluations < max_evaluations)):
+        if fc < fd:
+            # Maximum is in [c, right]; old d becomes the new c
+            left, c, fc = c, d, fd
+            d = left + _INV_PHI * (right - left)
+            if d <= c:
+                break  # No new point left between c and right
+            fd = g(d)
+        else:
+            # Maximum is in [left, d]; old c becomes the new d
+            right, d, fd = d, c, fc
+            c = right - _INV_PHI * (right - left)
+            if c >= d:
+                break  # No new point left between left and d
+            fc = g(c)
+
+    return (c if fc >= fd else d), g.evaluations
+
+
+def brent_search_max(f, left, right, precision=1e-9, max_evaluations=None, cache=None):
+    """
+    Finds the x-value that maximizes a unimodal function f(x) within [left, right].
+
+    Brent's method: it fits a parabola through the three best points and jumps
+    to its vertex when that step is safe, and falls back to a golden-section
+    step otherwise. On smooth functions it needs far fewer calls to f than
+    golden-section search. Evaluated points are memoized.
+
+    Args:
+        f (callable): Unimodal function to maximize.
+        left (float): Left bound of search interval.
+        right (float): Right bound of search interval.
+        precision (float): Desired precision (tolerance); points closer than
+            about sqrt(machine epsilon) * |x| are never evaluated separately.
+        max_evaluations (int): Optional budget of calls to f.
+        cache (dict): Optional x -> f(x) memo, shared between searches.
+
+    Returns:
+        tuple: (approximate x-value where f(x) is maximum, number of calls to f).
+    """
+    _check_budget(max_evaluations)
+    g = _MemoizedFunction(f, cache)
+
+    # x: best point so far, w: second best, v: previous w (all maximize g)
+    a, b = left, right
+    x = w = v = a + _INV_PHI2 * (b - a)
+    fx = fw = fv = g(x)
+    d = e = 0.0
+
+    while max_evaluations is None or g.evaluations < max_evaluations:
+        m = (a + b) / 2
+        tol = _SQRT_EPS * abs(x) + precision / 4
+        if abs(x - m) <= 2 * tol - (b - a) / 2:
+            break
+
+        golden = True
+        if abs(e) > tol:
+            # Parabola through (v, fv), (w, fw), (x, fx)
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2 * (q - r)
+            if q > 0:
+                p = -p
+            else:
+                q = -q
+            previous, e = e, d
+            # Accept the step only if it stays inside (a, b) and shrinks fast enough
+            if abs(p) < abs(0.5 * q * previous) and q * (a - x) < p < q * (b - x):
+                golden = False
+                d = p / q
+                u = x + d
+                if u - a < 2 * tol or b - u < 2 * tol:
+                    d = math.copysign(tol, m - x)
+        if golden:
+            e = (a - x) if x >= m else (b - x)
+            d = _INV_PHI2 * e
+
+        u = x + d if abs(d) >= tol else x + math.copysign(tol, d)
+        fu = g(u)
+        if fu >= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, w, x = w, x, u
+            fv, fw, fx = fw, fx, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu >= fw or w == x:
+                v, w = w, u
+                fv, fw = fw, fu
+            elif fu >= fv or v == x or v == w:
+                v, fv = u, fu
+
+    return x, g.evaluations
+
+
 # Example usage and demonstration
 if __name__ == "__main__":
     print("🔍 Ternary Search Examples")
@@ -87,4 +250,11 @@ if __name__ == "__main__":
     max_x = ternary_search_function_max(f, 0, 6)
     max_y = f(max_x)
     print(f"✅ Maximum at x ≈ {max_x:.6f}")
-    print(f"   f({max_x:.6f}) = {max_y:.6f}")
\ No newline at end of file
+    print(f"   f({max_x:.6f}) = {max_y:.6f}")
+
+    # --- Example 3: Fewer evaluations of an expensive function ---
+    print("\n🪙 Example 3: Golden-Section and Brent's Method")
+    golden_x, golden_calls = golden_section_search_max(f, 0, 6)
+    brent_x, brent_calls = brent_search_max(f, 0, 6)
+    print(f"✅ Golden-section: x ≈ {golden_x:.6f} after {golden_calls} evaluations")
+    print(f"✅ Brent's method: x ≈ {brent_x:.6f} after {brent_calls} evaluations")
\ No newline at end of file
@@ -0,0 +1,93 @@
+import random
+import sys
+import unittest
+from array import array
+from unittest import mock
+from batch_peak_search import ternary_search_peak_many
+from ternary_search import ternary_search_peak
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def mountains(count, width, seed):
+    # Strictly increasing, then strictly decreasing rows with random peaks
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        peak = rng.randrange(width)
+        up = sorted(rng.sample(range(1000), peak))
+        down = sorted(rng.sample(range(1000), width - peak - 1), reverse=True)
+        rows.append(up + [2000] + down)
+    return rows
+
+
+class TestBatchPeakSearch(unittest.TestCase):
+
+    def test_list_of_rows(self):
+        for width in (1, 2, 3, 8, 37):
+            rows = mountains(200, width, width)
+            self.assertEqual(list(ternary_search_peak_many(rows)), [row.index(2000) for row in rows])
+
+    def test_matches_ternary_search_peak(self):
+        rows = [[1, 3, 5, 7, 8, 6, 4, 2], [10, 8, 6, 4], [1, 3, 5, 7], [5], [7, 3], [3, 7]]
+        self.assertEqual(list(ternary_search_peak_many(rows)), [ternary_search_peak(row) for row in rows])
+
+    def test_ragged_and_empty_rows(self):
+        self.assertEqual(list(ternary_search_peak_many([[1, 2, 1], [3], []])), [1, 0, -1])
+        self.assertEqual(list(ternary_search_peak_many([])), [])
+
+    def test_flat_buffer(self):
+        rows = mountains(100, 13, 4)
+        flat = array("d", [x for row in rows for x in row])
+        expected = [row.index(2000) for row in rows]
+        self.assertEqual(list(ternary_search_peak_many(flat, width=13)), expected)
+        self.assertEqual(list(ternary_search_peak_many(memoryview(flat), width=13)), expected)
+
+    def test_two_dimensional_memoryview(self):
+        flat = array("i", [1, 5, 2, 9, 3, 1])
+        view = memoryview(flat).cast("B").cast("i", shape=[2, 3])
+        self.assertEqual(list(ternary_search_peak_many(view)), [1, 0])
+
+    def test_buffer_errors(self):
+        with self.assertRaises(ValueError):
+            ternary_search_peak_many(array("d", [1, 2, 3]))
+        with self.assertRaises(ValueError):
+            ternary_search_peak_many(array("d", [1, 2, 3]), width=2)
+
+    def test_without_numpy(self):
+        rows = mountains(50, 9, 2)
+        expected = [row.index(2000) for row in rows]
+        flat = array("d", [x for row in rows for x in row])
+        # A None entry in sys.modules makes "import numpy" raise ImportError
+        with mock.patch.dict(sys.modules, {"numpy": None}):
+            for result in (ternary_search_peak_many(rows), ternary_search_peak_many(flat, width=9)):
+                self.assertIsInstance(result, array)
+                self.assertEqual(list(result), expected)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_rows(self):
+        rows = mountains(500, 21, 9)
+        values = numpy.array(rows, dtype=numpy.float64)
+        expected = [row.index(2000) for row in rows]
+        self.assertEqual(ternary_search_peak_many(values).tolist(), expected)
+        self.assertEqual(ternary_search_peak_many(memoryview(values)).tolist(), expected)
+        with self.assertRaises(ValueError):
+            ternary_search_peak_many(values.ravel())
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_lists_and_buffers_are_vectorized(self):
+        rows = mountains(300, 17, 6)
+        expected = [row.index(2000) for row in rows]
+        flat = array("i", [x for row in rows for x in row])
+        for result in (ternary_search_peak_many(rows),
+                       ternary_search_peak_many(flat, width=17),
+                       ternary_search_peak_many(memoryview(flat), width=17)):
+            self.assertIsInstance(result, numpy.ndarray)
+            self.assertEqual(result.tolist(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from parallel_ksection_search import k_section_search_max, k_section_search_max_async
+
+
+def parabola(x):
+    return -(x - 3)**2 + 10  # Max at x=3
+
+
+class TestParallelKSectionSearch(unittest.TestCase):
+
+    def test_thread_pool(self):
+        for k in (2, 3, 8):
+            x, evaluations = k_section_search_max(parabola, 0, 6, k=k, executor="thread", workers=2)
+            self.assertAlmostEqual(x, 3.0, delta=1e-6)
+            self.assertGreater(evaluations, 0)
+
+    def test_process_pool(self):
+        x, _ = k_section_search_max(parabola, 0, 6, precision=1e-6, k=4, executor="process", workers=2)
+        self.assertAlmostEqual(x, 3.0, delta=1e-5)
+
+    def test_existing_executor_is_left_running(self):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            x, _ = k_section_search_max(parabola, 0, 6, k=4, executor=pool)
+            self.assertAlmostEqual(x, 3.0, delta=1e-6)
+            self.assertEqual(pool.submit(parabola, 3).result(), 10)
+
+    def test_odd_k_reuses_best_point(self):
+        calls = []
+
+        def f(x):
+            calls.append(x)
+            return parabola(x)
+        _, evaluations = k_section_search_max(f, 0, 6, k=5, executor="thread", workers=1)
+        self.assertEqual(evaluations, len(calls))
+        self.assertEqual(len(set(calls)), len(calls))
+
+    def test_more_points_need_fewer_rounds(self):
+        rounds = {}
+        for k in (2, 8):
+            _, evaluations = k_section_search_max(parabola, 0, 6, k=k, executor="thread", workers=1)
+            rounds[k] = evaluations / k
+        self.assertLess(rounds[8], rounds[2] / 2)
+
+    def test_large_bracket_terminates(self):
+        # precision 1e-9 is far below the float spacing near 3e9
+        def f(x):
+            return -(x - 3e9)**2
+        for k in (2, 3, 8):
+            x, evaluations = k_section_search_max(f, 0, 6e9, k=k, executor="thread", workers=1)
+            self.assertAlmostEqual(x / 3e9, 1.0, delta=1e-6)
+            self.assertLess(evaluations, 1000)
+
+    def test_evaluation_budget(self):
+        x, evaluations = k_section_search_max(parabola, -100, 100, k=4, executor="thread", max_evaluations=10)
+        self.assertLessEqual(evaluations, 10)
+        self.assertLess(abs(x - 3), 100)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            k_section_search_max(parabola, 0, 6, k=1, executor="thread")
+        with self.assertRaises(ValueError):
+            k_section_search_max(parabola, 0, 6, k=4, executor="thread", max_evaluations=3)
+        with self.assertRaises(ValueError):
+            k_section_search_max(parabola, 0, 6, k=4, executor="fiber")
+
+    def test_async_coroutine_objective(self):
+        async def f(x):
+            await asyncio.sleep(0)
+            return parabola(x)
+        x, evaluations = asyncio.run(k_section_search_max_async(f, 0, 6, k=4))
+        self.assertAlmostEqual(x, 3.0, delta=1e-6)
+        self.assertGreater(evaluations, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,10 @@
 import unittest
-from ternary_search import ternary_search_peak, ternary_search_function_max
+from ternary_search import (
+    brent_search_max,
+    golden_section_search_max,
+    ternary_search_function_max,
+    ternary_search_peak,
+)
 
 
 class TestTernarySearch(unittest.TestCase):
@@ -42,5 +47,68 @@ class TestTernarySearch(unittest.TestCase):
         self.assertEqual(arr[result], 5)
 
 
+    def test_golden_section_maximum(self):
+        def f(x):
+            return -(x - 3)**2 + 10  # Max at x=3
+        x, evaluations = golden_section_search_max(f, 0, 6)
+        self.assertAlmostEqual(x, 3.0, delta=1e-5)
+        # One call per step plus the two starting points
+        self.assertLessEqual(evaluations, 52)
+
+    def test_brent_maximum(self):
+        def f(x):
+            return -(x - 3)**2 + 10  # Max at x=3
+        x, evaluations = brent_search_max(f, 0, 6)
+        self.assertAlmostEqual(x, 3.0, delta=1e-5)
+        self.assertLess(evaluations, 20)
+
+    def test_maximizers_on_non_smooth_function(self):
+        def f(x):
+            return -abs(x - 2.3)
+        for search in (golden_section_search_max, brent_search_max):
+            x, _ = search(f, -10, 10, precision=1e-7)
+            self.assertAlmostEqual(x, 2.3, delta=1e-5)
+
+    def test_evaluation_count_is_exact(self):
+        calls = []
+
+        def f(x):
+            calls.append(x)
+            return -(x + 1.5)**2
+        for search in (golden_section_search_max, brent_search_max):
+            calls.clear()
+            _, evaluations = search(f, -4, 4)
+            self.assertEqual(evaluations, len(calls))
+            self.assertEqual(len(set(calls)), len(calls))  # Never the same point twice
+
+    def test_evaluation_budget(self):
+        def f(x):
+            return -(x - 1)**2
+        for search in (golden_section_search_max, brent_search_max):
+            x, evaluations = search(f, -100, 100, max_evaluations=10)
+            self.assertLessEqual(evaluations, 10)
+            self.assertLess(abs(x - 1), 100)
+            with self.assertRaises(ValueError):
+                search(f, 0, 1, max_evaluations=1)
+
+    def test_large_bracket_terminates(self):
+        # precision 1e-9 is far below the float spacing near 3e9
+        def f(x):
+            return -(x - 3e9)**2
+        for search in (golden_section_search_max, brent_search_max):
+            x, evaluations = search(f, 0, 6e9)
+            self.assertAlmostEqual(x / 3e9, 1.0, delta=1e-6)
+            self.assertLess(evaluations, 200)
+
+    def test_shared_cache(self):
+        def f(x):
+            return -(x - 0.5)**2
+        cache = {}
+        _, first = golden_section_search_max(f, 0, 1, cache=cache)
+        _, second = golden_section_search_max(f, 0, 1, cache=cache)
+        self.assertGreater(first, 0)
+        self.assertEqual(second, 0)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -98,32 +98,33 @@ def iddfs(root, goal, get_neighbors, max_depth=float('inf')):
 
 # --- Example Usage ---
 
-# Define a simple graph structure using an adjacency list (dictionary)
-graph = {
-    'A': ['B', 'C', 'D'],
-    'B': ['A', 'E', 'F'],
-    'C': ['A'],
-    'D': ['A', 'G', 'H'],
-    'E': ['B', 'I'],
-    'F': ['B'],
-    'G': ['D'],
-    'H': ['D'],
-    'I': ['E']
-}
-
-def get_neighbors(node):
-    """Function to get neighbors of a given node from the graph."""
-    return graph.get(node, [])
-
-# Example: Find path from 'A' to 'G'
-start_node = 'A'
-target_node = 'G'
-
-print(f"Starting IDDFS from '{start_node}' to find '{target_node}'")
-path, depth_found = iddfs(start_node, target_node, get_neighbors)
-
-if path:
-    print(f"\n🎉 Final Result: Goal '{target_node}' found at depth {depth_found}!")
-    print(f"Path: {' -> '.join(path)}")
-else:
-    print(f"\n❌ Final Result: Goal '{target_node}' was not found within the maximum allowed depth.")
\ No newline at end of file
+if __name__ == "__main__":
+    # Define a simple graph structure using an adjacency list (dictionary)
+    graph = {
+        'A': ['B', 'C', 'D'],
+        'B': ['A', 'E', 'F'],
+        'C': ['A'],
+        'D': ['A', 'G', 'H'],
+        'E': ['B', 'I'],
+        'F': ['B'],
+        'G': ['D'],
+        'H': ['D'],
+        'I': ['E']
+    }
+
+    def get_neighbors(node):
+        """Function to get neighbors of a given node from the graph."""
+        return graph.get(node, [])
+
+    # Example: Find path from 'A' to 'G'
+    start_node = 'A'
+    target_node = 'G'
+
+    print(f"Starting IDDFS from '{start_node}' to find '{target_node}'")
+    path, depth_found = iddfs(start_node, target_node, get_neighbors)
+
+    if path:
+        print(f"\n🎉 Final Result: Goal '{target_node}' found at depth {depth_found}!")
+        print(f"Path: {' -> '.join(path)}")
+    else:
+        print(f"\n❌ Final Result: Goal '{target_node}' was not found within the maximum allowed depth.")